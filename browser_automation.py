@@ -2,66 +2,568 @@
 Browser automation module - Handles account creation, login, and form filling
 """
 from playwright.sync_api import sync_playwright, Page, Browser, TimeoutError
+from playwright.async_api import async_playwright
+import asyncio
+import os
 import time
 import json
-from typing import Dict, Any, Optional, List
+import re
+import hashlib
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple, Union
 from pathlib import Path
+from queue import Empty, Queue
 import random
 
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+# Resolves and sets every field in a single evaluate call instead of one CDP
+# round-trip per field. Prefers the first visible match for each selector,
+# matches <select> options by value or label, and reports per-field results.
+BULK_FILL_JS = """
+(fields) => fields.map((f) => {
+    let candidates = [];
+    try {
+        candidates = Array.from(document.querySelectorAll(f.sel));
+    } catch (e) {
+        return {sel: f.sel, ok: false};
+    }
+    const el = candidates.find((c) => c.getClientRects().length > 0) || candidates[0];
+    if (!el) {
+        return {sel: f.sel, ok: false};
+    }
+    if (f.type === 'select' && el.tagName === 'SELECT') {
+        const wanted = String(f.val).trim().toLowerCase();
+        const option = Array.from(el.options).find(
+            (o) => o.value === f.val || o.text.trim().toLowerCase() === wanted
+        );
+        if (!option) {
+            return {sel: f.sel, ok: false};
+        }
+        el.value = option.value;
+    } else {
+        const desc = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value');
+        if (desc && desc.set) {
+            desc.set.call(el, f.val);
+        } else {
+            el.value = f.val;
+        }
+    }
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    return {sel: f.sel, ok: true};
+})
+"""
+
+# Success phrases shown after following a verification link. Anchored at a
+# word start so "unverified" or "unsuccessful" are not read as success.
+_VERIFY_RE = re.compile(r'\b(?:verified|confirmed|activated|success|thank you)', re.I)
+
+# Requests irrelevant to filling forms, aborted when block_resources is on
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+_TRACKER_HOSTS = (
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+    'hotjar.com', 'segment.io', 'segment.com'
+)
+
+
+def _should_block(request) -> bool:
+    """Whether a request can be skipped without affecting form automation"""
+    return (request.resource_type in _BLOCKED_RESOURCE_TYPES
+            or any(host in request.url for host in _TRACKER_HOSTS))
+
+# Saved login sessions (cookies + local storage), one file per account
+DEFAULT_SESSION_DIR = Path.home() / '.uni_auto'
+
+DEFAULT_SCREENSHOT_DIR = Path('/home/user/student-application-automation/screenshots')
+
+# Screenshots are JPEG: several times smaller and quicker to encode than
+# PNG, and plenty for confirmation/debug captures
+SCREENSHOT_OPTIONS = {'type': 'jpeg', 'quality': 60}
+
+# Writes screenshot files so the caller doesn't wait on disk I/O. Playwright
+# objects are bound to their thread, so the capture itself stays inline.
+_screenshot_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='screenshot')
+
+
+def _write_screenshot(filepath: Path, raw: bytes) -> Future:
+    """Queue a screenshot file write; a failure is logged when it happens"""
+    def log_failure(future):
+        error = future.exception()
+        if error is not None:
+            log.error("writing screenshot %s failed: %s", filepath, error)
+    
+    write = _screenshot_writer.submit(filepath.write_bytes, raw)
+    write.add_done_callback(log_failure)
+    return write
+
+
+def _write_failed(write: Optional[Future]) -> bool:
+    """Whether a finished screenshot write raised"""
+    return write is not None and write.done() and write.exception() is not None
+
+
+def _storage_state_path(session_dir: Path, email: str) -> Path:
+    """Stable per-account file for a saved login session"""
+    digest = hashlib.sha256(email.strip().lower().encode('utf-8')).hexdigest()[:16]
+    return session_dir / f"{digest}.json"
+
+
+def _redirected_away(current_url: str, login_url: str) -> bool:
+    """Whether the browser left the login page after navigating to it"""
+    return current_url.split('?')[0].rstrip('/') != login_url.split('?')[0].rstrip('/')
+
+# Options for every browser context created by the automation classes
+CONTEXT_OPTIONS = {
+    'viewport': {'width': 1920, 'height': 1080},
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+
+def _context_options(fast_unsafe: bool, storage_state_path: str = None) -> Dict[str, Any]:
+    """new_context() arguments shared by the sync and async automation classes"""
+    context_options = dict(CONTEXT_OPTIONS)
+    if fast_unsafe:
+        context_options['ignore_https_errors'] = True
+    if storage_state_path:
+        context_options['storage_state'] = str(storage_state_path)
+    return context_options
+
+
+# Chromium flags for trusted portals only: one renderer process for all
+# origins instead of per-site isolation, and no /dev/shm or sandbox limits
+FAST_UNSAFE_ARGS = [
+    '--disable-features=IsolateOrigins,site-per-process',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+]
+
+
+# Default signup field mapping (customize per university)
+DEFAULT_SIGNUP_FIELD_MAPPING = {
+    'first_name': '#firstName, [name="firstName"], input[type="text"][placeholder*="First"]',
+    'last_name': '#lastName, [name="lastName"], input[type="text"][placeholder*="Last"]',
+    'email': '#email, [name="email"], input[type="email"]',
+    'password': '#password, [name="password"], input[type="password"]',
+    'phone': '#phone, [name="phone"], input[type="tel"]',
+}
+
+# Login field candidates, tried in order
+LOGIN_EMAIL_SELECTORS = (
+    '#email', '#username', '[name="email"]', '[name="username"]',
+    'input[type="email"]', 'input[placeholder*="Email"]'
+)
+LOGIN_PASSWORD_SELECTORS = (
+    '#password', '[name="password"]', 'input[type="password"]'
+)
+
+
+@lru_cache(maxsize=32)
+def _submit_button_selector(button_texts: Tuple[str, ...]) -> str:
+    """Build one selector matching any visible candidate submit button"""
+    parts = []
+    for text in button_texts:
+        quoted = text.replace('"', '\\"')
+        parts.append(f'button:has-text("{quoted}"):visible')
+        parts.append(f'[role="button"]:has-text("{quoted}"):visible')
+        parts.append(f'input[type="submit"][value*="{quoted}"]:visible')
+    
+    # Any submit control as a last resort
+    parts.append('button[type="submit"]:visible')
+    parts.append('input[type="submit"]:visible')
+    return ', '.join(parts)
+
+
+# (field name, selector, field type) for every mapped field of a form
+CompiledMapping = Tuple[Tuple[str, str, str], ...]
+
+
+def _signup_fields(student_data: Dict[str, Any],
+                   password: str,
+                   field_mapping: Union[Dict[str, str], CompiledMapping] = None) -> List[Tuple[str, str, str]]:
+    """Build (selector, value, field_type) tuples for a signup form"""
+    field_mapping = field_mapping or DEFAULT_SIGNUP_FIELD_MAPPING
+    if isinstance(field_mapping, dict):
+        pairs = field_mapping.items()
+    else:
+        # Compiled mapping; signup fields are always plain text
+        pairs = ((field_name, selector) for field_name, selector, _ in field_mapping)
+    
+    fields = []
+    for field_name, selector in pairs:
+        if field_name in student_data and student_data[field_name]:
+            fields.append((selector, str(student_data[field_name]), 'text'))
+        elif field_name == 'password':
+            fields.append((selector, password, 'text'))
+    
+    return fields
+
+
+def compile_field_mapping(field_mapping: Dict[str, str],
+                          field_types: Dict[str, str] = None) -> CompiledMapping:
+    """
+    Resolve each mapped field's type once so it can be reused per student
+    
+    Args:
+        field_mapping: Mapping of student fields to selectors
+        field_types: Optional explicit types from the university config
+        
+    Returns:
+        Tuple of (field name, selector, field type)
+    """
+    field_types = field_types or {}
+    compiled = []
+    for field_name, selector in field_mapping.items():
+        field_type = field_types.get(field_name)
+        if not field_type:
+            # Determine field type
+            field_type = 'text'
+            if 'date' in field_name.lower():
+                field_type = 'date'
+            elif field_name in ['state', 'country', 'gender']:
+                field_type = 'select'
+        compiled.append((field_name, selector, field_type))
+    return tuple(compiled)
+
+
+def _application_fields(student_data: Dict[str, Any],
+                        field_mapping: Union[Dict[str, str], CompiledMapping]) -> List[Tuple[str, str, str]]:
+    """Build (selector, value, field_type) tuples for an application form"""
+    if isinstance(field_mapping, dict):
+        field_mapping = compile_field_mapping(field_mapping)
+    
+    fields = []
+    for field_name, selector, field_type in field_mapping:
+        value = student_data.get(field_name)
+        if value:
+            fields.append((selector, str(value), field_type))
+    
+    return fields
+
+
 class BrowserAutomation:
     """Automate browser interactions for university applications"""
     
-    def __init__(self, headless: bool = False, slow_mo: int = 100):
+    def __init__(self,
+                 headless: bool = False,
+                 slow_mo: int = 0,
+                 human_delay: bool = False,
+                 block_resources: bool = True,
+                 session_dir: str = None,
+                 fast_unsafe: bool = False,
+                 screenshot_dir: str = None):
         """
         Initialize browser automation
         
         Args:
             headless: Run browser in headless mode
-            slow_mo: Slow down operations by N milliseconds
+            slow_mo: Slow down every operation by N milliseconds (debugging only)
+            human_delay: Add human-like random pauses before submitting forms
+            block_resources: Skip images, media, fonts and analytics requests
+            session_dir: Directory for saved login sessions
+            fast_unsafe: Drop site isolation and sandboxing and ignore HTTPS
+                errors; only for trusted portals
+            screenshot_dir: Directory that take_screenshot writes to
         """
         self.headless = headless
         self.slow_mo = slow_mo
+        self.human_delay = human_delay
+        self.block_resources = block_resources
+        self.session_dir = Path(session_dir) if session_dir else DEFAULT_SESSION_DIR
+        self.fast_unsafe = fast_unsafe
+        self.screenshot_dir = Path(screenshot_dir) if screenshot_dir else DEFAULT_SCREENSHOT_DIR
+        try:
+            self.screenshot_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            # Not fatal: only take_screenshot needs it, and it reports its own failure
+            log.warning("could not create screenshot directory %s: %s", self.screenshot_dir, e)
+        self._session_restored = False
         self.playwright = None
         self.browser = None
         self.context = None
         self.page = None
+        self._owns_browser = True
+        
+        # Context and page opened by start_browser; self.context/self.page
+        # point at a pooled one while it is borrowed
+        self._primary_context = None
+        self._primary_page = None
+        
+        # Pre-opened contexts shared across batched jobs (see acquire_page)
+        self._ctx_pool: Optional[Queue] = None
+        self._pooled_contexts: List[Any] = []
+        
+        # Resolved elements for the current page, and the strategy
+        # (css/label/placeholder) that worked for each selector
+        self._selector_cache: Dict[str, Any] = {}
+        self._selector_strategy: Dict[str, str] = {}
+        
+        # Hash and path of the last screenshot written to disk
+        self._last_shot_hash: Optional[str] = None
+        self._last_shot_path: Optional[str] = None
+        self._last_shot_write: Optional[Future] = None
+    
+    def start_browser(self, storage_state_path: str = None, pool_size: int = 0):
+        """
+        Start browser instance
+        
+        If the CDP_ENDPOINT environment variable is set, connect to that
+        already-running Chromium instead of launching a new one. One shared
+        browser can then serve many jobs, each paying only for a new context.
+        
+        Args:
+            storage_state_path: Saved login session to load into the context
+            pool_size: Number of extra contexts to pre-open for acquire_page()
+        """
+        self._launch()
+        
+        if storage_state_path and Path(storage_state_path).exists():
+            self._session_restored = True
+        else:
+            storage_state_path = None
+        
+        self.context = self._new_context(storage_state_path)
+        self.page = self.context.new_page()
+        self._primary_context = self.context
+        self._primary_page = self.page
+        
+        if pool_size:
+            self._ctx_pool = Queue()
+            for _ in range(pool_size):
+                self._ctx_pool.put(self._new_pooled_context())
+        
+        return self.page
     
-    def start_browser(self):
-        """Start browser instance"""
+    def _launch(self):
+        """Start Playwright and launch Chromium (or connect to CDP_ENDPOINT)"""
         self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(
+        
+        cdp_endpoint = os.environ.get('CDP_ENDPOINT')
+        if cdp_endpoint:
+            self.browser = self.playwright.chromium.connect_over_cdp(
+                cdp_endpoint,
+                slow_mo=self.slow_mo
+            )
+            self._owns_browser = False
+        else:
+            self.browser = self.playwright.chromium.launch(
+                headless=self.headless,
+                slow_mo=self.slow_mo,
+                args=FAST_UNSAFE_ARGS if self.fast_unsafe else None
+            )
+            self._owns_browser = True
+    
+    def new_session(self) -> 'BrowserAutomation':
+        """
+        Create a session with its own context and page on this browser
+        
+        Launches the browser on first use. Closing the session with
+        close_session() leaves the browser running for the next one.
+        """
+        if not self.browser:
+            self._launch()
+        
+        session = BrowserAutomation(
             headless=self.headless,
-            slow_mo=self.slow_mo
-        )
-        self.context = self.browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            slow_mo=self.slow_mo,
+            human_delay=self.human_delay,
+            block_resources=self.block_resources,
+            session_dir=str(self.session_dir),
+            fast_unsafe=self.fast_unsafe,
+            screenshot_dir=str(self.screenshot_dir)
         )
-        self.page = self.context.new_page()
-        return self.page
+        session.browser = self.browser
+        session._owns_browser = False
+        session.context = session._new_context()
+        session.page = session.context.new_page()
+        return session
     
-    def close_browser(self):
-        """Close browser instance"""
+    def close_session(self):
+        """Close this session's page and context"""
         if self.page:
             self.page.close()
+            self.page = None
         if self.context:
             self.context.close()
-        if self.browser:
+            self.context = None
+    
+    def _new_context(self, storage_state_path: str = None):
+        """Create a browser context with the standard options and routing"""
+        context = self.browser.new_context(**_context_options(self.fast_unsafe, storage_state_path))
+        if self.block_resources:
+            context.route('**/*', self._route_request)
+        return context
+    
+    def acquire_page(self) -> Page:
+        """
+        Borrow a pre-opened page from the context pool
+        
+        The borrowed page becomes the active page for navigate_to, form
+        filling, etc. Sync Playwright runs on this one thread, so nothing
+        could return a context while we wait: an empty pool is an error.
+        
+        Returns:
+            Page ready for navigation
+            
+        Raises:
+            RuntimeError: If start_browser(pool_size=...) was not called, or
+                every pooled context is borrowed
+        """
+        if self._ctx_pool is None:
+            raise RuntimeError("start_browser(pool_size=...) was not called")
+        
+        try:
+            context = self._ctx_pool.get_nowait()
+        except Empty:
+            raise RuntimeError(
+                f"All {len(self._pooled_contexts)} pooled contexts are in use; "
+                "call release_page() before acquiring another"
+            ) from None
+        self.context = context
+        self.page = context.pages[0]
+        self._selector_cache.clear()
+        self._last_shot_hash = None
+        return self.page
+    
+    def release_page(self, page: Page):
+        """
+        Return a borrowed page's slot to the pool
+        
+        The context is closed and replaced by a fresh one, so no cookies,
+        localStorage, sessionStorage or IndexedDB of one student reach the
+        next.
+        
+        Args:
+            page: Page previously returned by acquire_page()
+        """
+        context = page.context
+        if self.context is context:
+            self.context = self._primary_context
+            self.page = self._primary_page
+        self._pooled_contexts.remove(context)
+        try:
+            context.close()
+        except Exception as e:
+            log.warning("closing pooled context failed: %s", e)
+        self._selector_cache.clear()
+        self._ctx_pool.put(self._new_pooled_context())
+    
+    def _new_pooled_context(self):
+        """Open a context with one page for the acquire_page pool"""
+        context = self._new_context()
+        context.new_page()
+        self._pooled_contexts.append(context)
+        return context
+    
+    def _route_request(self, route):
+        """Abort requests that do not matter for form automation"""
+        if _should_block(route.request):
+            route.abort()
+        else:
+            route.continue_()
+    
+    def close_browser(self):
+        """Close browser instance"""
+        active_context = self.context
+        self.close_session()
+        for context in [self._primary_context, *self._pooled_contexts]:
+            if context is not None and context is not active_context:
+                context.close()
+        self._primary_context = None
+        self._primary_page = None
+        self._pooled_contexts = []
+        self._ctx_pool = None
+        # Leave a shared CDP browser running for other jobs
+        if self.browser and self._owns_browser:
             self.browser.close()
+        self.browser = None
         if self.playwright:
             self.playwright.stop()
+            self.playwright = None
     
-    def navigate_to(self, url: str, wait_for_load: bool = True):
-        """Navigate to URL"""
+    def navigate_to(self, url: str, wait_for_load: bool = True, ready_selector: str = None):
+        """
+        Navigate to URL
+        
+        Args:
+            url: URL to open
+            wait_for_load: Wait for the page to become usable after DOMContentLoaded
+            ready_selector: Optional selector that marks the page as ready
+        """
         if not self.page:
             self.start_browser()
         
-        self.page.goto(url)
+        previous_url = self.page.url
+        self.page.goto(url, wait_until='domcontentloaded', timeout=15000)
+        self._selector_cache.clear()
+        if self.page.url != previous_url:
+            self._last_shot_hash = None
+        
+        if not wait_for_load:
+            return
+        
+        if ready_selector:
+            try:
+                self.page.wait_for_selector(ready_selector, state='visible', timeout=5000)
+            except TimeoutError:
+                pass
+        else:
+            # Portals with analytics beacons never reach network idle, so cap the probe
+            try:
+                self.page.wait_for_load_state('networkidle', timeout=1500)
+            except TimeoutError:
+                pass
+    
+    def _locate(self, selector: str, strategy: str):
+        """Locate an element using a single strategy"""
+        try:
+            if strategy == 'css':
+                return self.page.wait_for_selector(selector, timeout=5000)
+            
+            if strategy == 'label':
+                locator = self.page.get_by_label(selector, exact=False)
+            else:
+                locator = self.page.get_by_placeholder(selector, exact=False)
+            
+            return locator.first if locator.count() else None
+        except:
+            return None
+    
+    def _resolve_field(self, selector: str):
+        """Resolve a field selector, reusing cached lookups for the current page"""
+        element = self._selector_cache.get(selector)
+        if element:
+            try:
+                if element.is_visible():
+                    return element
+            except:
+                pass
+            del self._selector_cache[selector]
+        
+        # Try the strategy that worked last time first
+        strategies = ['css', 'label', 'placeholder']
+        known = self._selector_strategy.get(selector)
+        if known:
+            strategies.remove(known)
+            strategies.insert(0, known)
+        
+        for strategy in strategies:
+            element = self._locate(selector, strategy)
+            if element:
+                self._selector_cache[selector] = element
+                self._selector_strategy[selector] = strategy
+                return element
         
-        if wait_for_load:
-            self.page.wait_for_load_state('networkidle', timeout=30000)
+        return None
     
-    def fill_form_field(self, selector: str, value: str, field_type: str = 'text'):
+    def fill_form_field(self,
+                        selector: str,
+                        value: str,
+                        field_type: str = 'text',
+                        no_wait_after: bool = True):
         """
         Fill a form field
         
@@ -69,57 +571,79 @@ class BrowserAutomation:
             selector: CSS selector or label text
             value: Value to fill
             field_type: Type of field (text, email, select, date, etc.)
+            no_wait_after: Don't wait for events triggered by the fill to settle;
+                pass False for the last field before a submit click
         """
         try:
-            # Try different selector strategies
-            element = None
-            
-            # Try CSS selector first
-            try:
-                element = self.page.wait_for_selector(selector, timeout=5000)
-            except:
-                pass
-            
-            # Try by label text
-            if not element:
-                try:
-                    element = self.page.get_by_label(selector, exact=False)
-                except:
-                    pass
-            
-            # Try by placeholder
-            if not element:
-                try:
-                    element = self.page.get_by_placeholder(selector, exact=False)
-                except:
-                    pass
+            element = self._resolve_field(selector)
             
             if not element:
-                print(f"Warning: Could not find field with selector: {selector}")
+                log.warning("could not find field with selector %s", selector)
                 return False
             
             # Fill based on field type
             if field_type == 'select':
-                element.select_option(value)
-            elif field_type == 'date':
-                element.fill(value)
+                element.select_option(value, no_wait_after=no_wait_after, timeout=2000)
             else:
-                element.fill(value)
+                element.fill(value, no_wait_after=no_wait_after, timeout=2000)
             
             # Add human-like delay
-            time.sleep(random.uniform(0.3, 0.8))
+            if self.human_delay:
+                time.sleep(random.uniform(0.3, 0.8))
             
             return True
             
         except Exception as e:
-            print(f"Error filling field {selector}: {e}")
+            log.warning("filling %s failed: %s", selector, e)
             return False
     
+    def bulk_fill(self, fields: List[Tuple[str, str, str]]) -> List[str]:
+        """
+        Fill several form fields with a single page.evaluate call
+        
+        Args:
+            fields: List of (selector, value, field_type) tuples
+            
+        Returns:
+            List of selectors that could not be filled
+        """
+        if not fields:
+            return []
+        
+        payload = [{'sel': sel, 'val': val, 'type': ftype} for sel, val, ftype in fields]
+        
+        try:
+            results = self.page.evaluate(BULK_FILL_JS, payload)
+        except Exception as e:
+            log.warning("bulk fill failed: %s", e)
+            return [sel for sel, _, _ in fields]
+        
+        missing = [r['sel'] for r in results if not r['ok']]
+        if missing:
+            log.debug("bulk fill could not set %d field(s): %s", len(missing), missing)
+        return missing
+    
+    def _fill_fields(self, fields: List[Tuple[str, str, str]]):
+        """Bulk fill fields, falling back to fill_form_field for unresolved selectors"""
+        missing = set(self.bulk_fill(fields))
+        retry = [field for field in fields if field[0] in missing]
+        
+        # Only the last field waits for its events to settle before submit
+        for i, (selector, value, field_type) in enumerate(retry):
+            self.fill_form_field(selector, value, field_type,
+                                 no_wait_after=i < len(retry) - 1)
+    
+    def _pre_submit_settle(self):
+        """Let debounced client-side validation finish before clicking submit"""
+        self.page.wait_for_timeout(300)
+        if self.human_delay:
+            time.sleep(random.uniform(0.5, 1.0))
+    
     def create_account(self, 
                        signup_url: str,
                        student_data: Dict[str, Any],
                        password: str,
-                       field_mapping: Dict[str, str] = None) -> bool:
+                       field_mapping: Union[Dict[str, str], CompiledMapping] = None) -> bool:
         """
         Create account on university portal
         
@@ -136,38 +660,36 @@ class BrowserAutomation:
             # Navigate to signup page
             self.navigate_to(signup_url)
             
-            # Default field mapping (customize per university)
-            if not field_mapping:
-                field_mapping = {
-                    'first_name': '#firstName, [name="firstName"], input[type="text"][placeholder*="First"]',
-                    'last_name': '#lastName, [name="lastName"], input[type="text"][placeholder*="Last"]',
-                    'email': '#email, [name="email"], input[type="email"]',
-                    'password': '#password, [name="password"], input[type="password"]',
-                    'phone': '#phone, [name="phone"], input[type="tel"]',
-                }
-            
             # Fill form fields
-            for field_name, selector in field_mapping.items():
-                if field_name in student_data and student_data[field_name]:
-                    self.fill_form_field(selector, str(student_data[field_name]))
-                elif field_name == 'password':
-                    self.fill_form_field(selector, password)
+            fields = _signup_fields(student_data, password, field_mapping)
+            self._fill_fields(fields)
             
             # Look for and click signup button
             submit_button = self.find_submit_button(['Sign Up', 'Create Account', 'Register', 'Submit'])
             
             if submit_button:
+                self._pre_submit_settle()
                 submit_button.click()
                 time.sleep(3)  # Wait for submission
                 return True
             else:
-                print("Could not find submit button")
+                log.warning("could not find submit button")
                 return False
                 
         except Exception as e:
-            print(f"Error creating account: {e}")
+            log.warning("creating account failed: %s", e)
             return False
     
+    def _try_selectors(self, selectors, action) -> Optional[str]:
+        """Run action on each selector until one succeeds; return that selector"""
+        for selector in selectors:
+            try:
+                action(selector)
+                return selector
+            except:
+                continue
+        return None
+    
     def login(self, 
               login_url: str,
               email: str,
@@ -184,58 +706,89 @@ class BrowserAutomation:
             bool: Success status
         """
         try:
+            state_path = _storage_state_path(self.session_dir, email)
+            if not self.page:
+                self.start_browser(storage_state_path=state_path)
+            elif state_path.exists():
+                self._restore_session(state_path)
+            
             self.navigate_to(login_url)
             
-            # Find and fill email/username field
-            email_selectors = [
-                '#email', '#username', '[name="email"]', '[name="username"]',
-                'input[type="email"]', 'input[placeholder*="Email"]'
-            ]
-            
-            for selector in email_selectors:
-                try:
-                    self.page.fill(selector, email, timeout=2000)
-                    break
-                except:
-                    continue
-            
-            # Find and fill password field
-            password_selectors = [
-                '#password', '[name="password"]', 'input[type="password"]'
-            ]
-            
-            for selector in password_selectors:
-                try:
-                    self.page.fill(selector, password, timeout=2000)
-                    break
-                except:
-                    continue
+            # Saved session still valid: the portal skipped the login form
+            if self._session_restored and self._is_logged_in(login_url):
+                return True
+            
+            # Find and fill email/username and password fields
+            self._try_selectors(
+                LOGIN_EMAIL_SELECTORS,
+                lambda selector: self.page.fill(selector, email, timeout=2000)
+            )
+            self._try_selectors(
+                LOGIN_PASSWORD_SELECTORS,
+                lambda selector: self.page.fill(selector, password, timeout=2000)
+            )
             
             # Click login button
             login_button = self.find_submit_button(['Login', 'Sign In', 'Log In', 'Submit'])
             
             if login_button:
+                pre_click_url = self.page.url
                 login_button.click()
-                self.page.wait_for_load_state('networkidle', timeout=10000)
+                self._wait_for_login_redirect(pre_click_url)
+                self._save_session(state_path)
                 return True
             
             return False
             
         except Exception as e:
-            print(f"Error logging in: {e}")
+            log.warning("login failed: %s", e)
             return False
     
+    def _wait_for_login_redirect(self, pre_click_url: str):
+        """Wait for the portal to leave the login URL after submitting credentials"""
+        try:
+            self.page.wait_for_url(lambda url: url != pre_click_url, timeout=10000)
+        except TimeoutError:
+            # Some portals log in without navigating; give XHR a short window
+            try:
+                self.page.wait_for_load_state('networkidle', timeout=1500)
+            except TimeoutError:
+                pass
+    
+    def _is_logged_in(self, login_url: str) -> bool:
+        """Whether the portal redirected away from a login form"""
+        return (_redirected_away(self.page.url, login_url)
+                and not self.page.locator('input[type="password"]').count())
+    
+    def _restore_session(self, state_path: Path):
+        """Load cookies from a saved login session into the current context"""
+        try:
+            state = json.loads(state_path.read_text())
+            self.context.add_cookies(state.get('cookies', []))
+            self._session_restored = True
+        except Exception as e:
+            log.warning("could not restore saved session: %s", e)
+    
+    def _save_session(self, state_path: Path):
+        """Save cookies and local storage so later runs can skip login"""
+        try:
+            state_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            self.context.storage_state(path=str(state_path))
+        except Exception as e:
+            log.warning("could not save session: %s", e)
+    
     def fill_application_form(self,
                              form_url: str,
                              student_data: Dict[str, Any],
-                             field_mapping: Dict[str, str]) -> bool:
+                             field_mapping: Union[Dict[str, str], CompiledMapping]) -> bool:
         """
         Fill application form
         
         Args:
             form_url: URL of application form
             student_data: Student information
-            field_mapping: Mapping of fields to selectors
+            field_mapping: Mapping of fields to selectors, or the result of
+                compile_field_mapping
             
         Returns:
             bool: Success status
@@ -243,24 +796,14 @@ class BrowserAutomation:
         try:
             self.navigate_to(form_url)
             
-            # Fill each field
-            for field_name, selector in field_mapping.items():
-                if field_name in student_data and student_data[field_name]:
-                    value = student_data[field_name]
-                    
-                    # Determine field type
-                    field_type = 'text'
-                    if 'date' in field_name.lower():
-                        field_type = 'date'
-                    elif field_name in ['state', 'country', 'gender']:
-                        field_type = 'select'
-                    
-                    self.fill_form_field(selector, str(value), field_type)
+            # Collect every field, then fill them in one batch
+            fields = _application_fields(student_data, field_mapping)
+            self._fill_fields(fields)
             
             return True
             
         except Exception as e:
-            print(f"Error filling application form: {e}")
+            log.warning("filling application form failed: %s", e)
             return False
     
     def submit_form(self) -> bool:
@@ -269,6 +812,7 @@ class BrowserAutomation:
             submit_button = self.find_submit_button(['Submit', 'Submit Application', 'Send', 'Apply'])
             
             if submit_button:
+                self._pre_submit_settle()
                 submit_button.click()
                 time.sleep(3)
                 return True
@@ -276,28 +820,18 @@ class BrowserAutomation:
             return False
             
         except Exception as e:
-            print(f"Error submitting form: {e}")
+            log.warning("submitting form failed: %s", e)
             return False
     
     def find_submit_button(self, button_texts: List[str]):
-        """Find submit button by text"""
-        for text in button_texts:
-            try:
-                button = self.page.get_by_role('button', name=text, exact=False)
-                if button.is_visible():
-                    return button
-            except:
-                continue
+        """Find submit button by text with a single locator query"""
+        button = self.page.locator(_submit_button_selector(tuple(button_texts))).first
         
-        # Try by type="submit"
         try:
-            button = self.page.locator('button[type="submit"], input[type="submit"]').first
-            if button.is_visible():
-                return button
-        except:
-            pass
-        
-        return None
+            button.wait_for(state='visible', timeout=1000)
+            return button
+        except TimeoutError:
+            return None
     
     def handle_verification_link(self, verification_url: str) -> bool:
         """
@@ -313,29 +847,521 @@ class BrowserAutomation:
             self.navigate_to(verification_url)
             time.sleep(2)
             
-            # Check for success message
-            success_indicators = [
-                'verified', 'confirmed', 'activated', 'success', 'thank you'
-            ]
+            # Check the visible text only; page.content() would ship the whole DOM
+            text = self.page.locator('body').inner_text(timeout=3000)
             
-            page_text = self.page.content().lower()
+            return bool(_VERIFY_RE.search(text))
             
-            return any(indicator in page_text for indicator in success_indicators)
+        except Exception as e:
+            log.warning("handling verification link failed: %s", e)
+            return False
+    
+    def take_screenshot(self, filename: str = None, wait: bool = False) -> Optional[str]:
+        """
+        Take screenshot of current page
+        
+        If the capture is identical to the previous one, nothing is written
+        and the path of the earlier file is returned. The file is saved as
+        JPEG (any other extension in filename is replaced) and written in
+        the background, so it may appear shortly after this returns.
+        
+        Args:
+            filename: File name inside screenshot_dir
+            wait: Wait for the file to be written (e.g. confirmation
+                screenshots kept as evidence)
+            
+        Returns:
+            Path of the screenshot, or None if wait was set and writing failed
+        """
+        if not filename:
+            filename = f"screenshot_{int(time.time())}.jpg"
+        
+        raw = self.page.screenshot(**SCREENSHOT_OPTIONS)
+        digest = hashlib.sha256(raw).hexdigest()
+        if digest != self._last_shot_hash or _write_failed(self._last_shot_write):
+            filepath = (self.screenshot_dir / filename).with_suffix('.jpg')
+            self._last_shot_write = _write_screenshot(filepath, raw)
+            self._last_shot_hash = digest
+            self._last_shot_path = str(filepath)
+        
+        if wait:
+            try:
+                self._last_shot_write.result()
+            except Exception:
+                # Already logged by the write's callback
+                return None
+        return self._last_shot_path
+
+
+class AsyncBrowserAutomation:
+    """
+    Async counterpart of BrowserAutomation
+    
+    One instance owns the Playwright driver and a single browser. Each job
+    runs in its own session (an isolated BrowserContext and page) that
+    shares that browser, so many applications can progress concurrently in
+    one process.
+    """
+    
+    def __init__(self,
+                 headless: bool = False,
+                 slow_mo: int = 0,
+                 human_delay: bool = False,
+                 block_resources: bool = True,
+                 session_dir: str = None,
+                 fast_unsafe: bool = False,
+                 screenshot_dir: str = None):
+        """
+        Initialize async browser automation
+        
+        Args:
+            headless: Run browser in headless mode
+            slow_mo: Slow down every operation by N milliseconds (debugging only)
+            human_delay: Add human-like random pauses before submitting forms
+            block_resources: Skip images, media, fonts and analytics requests
+            session_dir: Directory for saved login sessions
+            fast_unsafe: Drop site isolation and sandboxing and ignore HTTPS
+                errors; only for trusted portals
+            screenshot_dir: Directory that take_screenshot writes to
+        """
+        self.headless = headless
+        self.slow_mo = slow_mo
+        self.human_delay = human_delay
+        self.block_resources = block_resources
+        self.session_dir = Path(session_dir) if session_dir else DEFAULT_SESSION_DIR
+        self.fast_unsafe = fast_unsafe
+        self.screenshot_dir = Path(screenshot_dir) if screenshot_dir else DEFAULT_SCREENSHOT_DIR
+        try:
+            self.screenshot_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            # Not fatal: only take_screenshot needs it, and it reports its own failure
+            log.warning("could not create screenshot directory %s: %s", self.screenshot_dir, e)
+        self._session_restored = False
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.page = None
+        self._owns_browser = True
+        
+        self._selector_cache: Dict[str, Any] = {}
+        self._selector_strategy: Dict[str, str] = {}
+        
+        # Hash and path of the last screenshot written to disk
+        self._last_shot_hash: Optional[str] = None
+        self._last_shot_path: Optional[str] = None
+        self._last_shot_write: Optional[Future] = None
+    
+    async def start_browser(self):
+        """Start the shared browser instance (or connect to CDP_ENDPOINT)"""
+        self.playwright = await async_playwright().start()
+        
+        cdp_endpoint = os.environ.get('CDP_ENDPOINT')
+        if cdp_endpoint:
+            self.browser = await self.playwright.chromium.connect_over_cdp(
+                cdp_endpoint,
+                slow_mo=self.slow_mo
+            )
+            self._owns_browser = False
+        else:
+            self.browser = await self.playwright.chromium.launch(
+                headless=self.headless,
+                slow_mo=self.slow_mo,
+                args=FAST_UNSAFE_ARGS if self.fast_unsafe else None
+            )
+            self._owns_browser = True
+        
+        return self.browser
+    
+    async def new_session(self) -> 'AsyncBrowserAutomation':
+        """Create a session with its own context and page on the shared browser"""
+        if not self.browser:
+            await self.start_browser()
+        
+        session = AsyncBrowserAutomation(
+            headless=self.headless,
+            slow_mo=self.slow_mo,
+            human_delay=self.human_delay,
+            block_resources=self.block_resources,
+            session_dir=str(self.session_dir),
+            fast_unsafe=self.fast_unsafe,
+            screenshot_dir=str(self.screenshot_dir)
+        )
+        session.browser = self.browser
+        session._owns_browser = False
+        session.context = await session._new_context()
+        session.page = await session.context.new_page()
+        return session
+    
+    async def _new_context(self, storage_state_path: str = None):
+        """Create a browser context with the standard options and routing"""
+        context = await self.browser.new_context(**_context_options(self.fast_unsafe, storage_state_path))
+        if self.block_resources:
+            await context.route('**/*', self._route_request)
+        return context
+    
+    async def _route_request(self, route):
+        """Abort requests that do not matter for form automation"""
+        if _should_block(route.request):
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def close_session(self):
+        """Close this session's page and context"""
+        if self.page:
+            await self.page.close()
+            self.page = None
+        if self.context:
+            await self.context.close()
+            self.context = None
+    
+    async def close_browser(self):
+        """Close the shared browser and stop Playwright"""
+        await self.close_session()
+        if self.browser and self._owns_browser:
+            await self.browser.close()
+        self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+    
+    async def run_many(self, jobs: List[Any]) -> List[Any]:
+        """
+        Run jobs concurrently, each in its own session
+        
+        Args:
+            jobs: Coroutine functions taking an AsyncBrowserAutomation session
+            
+        Returns:
+            List of job results (exceptions are returned, not raised)
+        """
+        if not self.browser:
+            await self.start_browser()
+        
+        async def run(job):
+            session = await self.new_session()
+            try:
+                return await job(session)
+            finally:
+                await session.close_session()
+        
+        return await asyncio.gather(*(run(job) for job in jobs), return_exceptions=True)
+    
+    async def navigate_to(self, url: str, wait_for_load: bool = True, ready_selector: str = None):
+        """Navigate to URL"""
+        if not self.page:
+            raise RuntimeError("No page open; create a session with new_session() first")
+        
+        previous_url = self.page.url
+        await self.page.goto(url, wait_until='domcontentloaded', timeout=15000)
+        self._selector_cache.clear()
+        if self.page.url != previous_url:
+            self._last_shot_hash = None
+        
+        if not wait_for_load:
+            return
+        
+        if ready_selector:
+            try:
+                await self.page.wait_for_selector(ready_selector, state='visible', timeout=5000)
+            except TimeoutError:
+                pass
+        else:
+            try:
+                await self.page.wait_for_load_state('networkidle', timeout=1500)
+            except TimeoutError:
+                pass
+    
+    async def _locate(self, selector: str, strategy: str):
+        """Locate an element using a single strategy"""
+        try:
+            if strategy == 'css':
+                return await self.page.wait_for_selector(selector, timeout=5000)
+            
+            if strategy == 'label':
+                locator = self.page.get_by_label(selector, exact=False)
+            else:
+                locator = self.page.get_by_placeholder(selector, exact=False)
+            
+            return locator.first if await locator.count() else None
+        except:
+            return None
+    
+    async def _resolve_field(self, selector: str):
+        """Resolve a field selector, reusing cached lookups for the current page"""
+        element = self._selector_cache.get(selector)
+        if element:
+            try:
+                if await element.is_visible():
+                    return element
+            except:
+                pass
+            del self._selector_cache[selector]
+        
+        strategies = ['css', 'label', 'placeholder']
+        known = self._selector_strategy.get(selector)
+        if known:
+            strategies.remove(known)
+            strategies.insert(0, known)
+        
+        for strategy in strategies:
+            element = await self._locate(selector, strategy)
+            if element:
+                self._selector_cache[selector] = element
+                self._selector_strategy[selector] = strategy
+                return element
+        
+        return None
+    
+    async def fill_form_field(self,
+                              selector: str,
+                              value: str,
+                              field_type: str = 'text',
+                              no_wait_after: bool = True):
+        """Fill a form field"""
+        try:
+            element = await self._resolve_field(selector)
+            
+            if not element:
+                log.warning("could not find field with selector %s", selector)
+                return False
+            
+            if field_type == 'select':
+                await element.select_option(value, no_wait_after=no_wait_after, timeout=2000)
+            else:
+                await element.fill(value, no_wait_after=no_wait_after, timeout=2000)
+            
+            if self.human_delay:
+                await asyncio.sleep(random.uniform(0.3, 0.8))
+            
+            return True
+            
+        except Exception as e:
+            log.warning("filling %s failed: %s", selector, e)
+            return False
+    
+    async def bulk_fill(self, fields: List[Tuple[str, str, str]]) -> List[str]:
+        """Fill several form fields with a single page.evaluate call"""
+        if not fields:
+            return []
+        
+        payload = [{'sel': sel, 'val': val, 'type': ftype} for sel, val, ftype in fields]
+        
+        try:
+            results = await self.page.evaluate(BULK_FILL_JS, payload)
+        except Exception as e:
+            log.warning("bulk fill failed: %s", e)
+            return [sel for sel, _, _ in fields]
+        
+        missing = [r['sel'] for r in results if not r['ok']]
+        if missing:
+            log.debug("bulk fill could not set %d field(s): %s", len(missing), missing)
+        return missing
+    
+    async def _fill_fields(self, fields: List[Tuple[str, str, str]]):
+        """Bulk fill fields, falling back to fill_form_field for unresolved selectors"""
+        missing = set(await self.bulk_fill(fields))
+        retry = [field for field in fields if field[0] in missing]
+        
+        # Only the last field waits for its events to settle before submit
+        for i, (selector, value, field_type) in enumerate(retry):
+            await self.fill_form_field(selector, value, field_type,
+                                       no_wait_after=i < len(retry) - 1)
+    
+    async def _pre_submit_settle(self):
+        """Let debounced client-side validation finish before clicking submit"""
+        await self.page.wait_for_timeout(300)
+        if self.human_delay:
+            await asyncio.sleep(random.uniform(0.5, 1.0))
+    
+    async def create_account(self,
+                             signup_url: str,
+                             student_data: Dict[str, Any],
+                             password: str,
+                             field_mapping: Union[Dict[str, str], CompiledMapping] = None) -> bool:
+        """Create account on university portal"""
+        try:
+            await self.navigate_to(signup_url)
+            
+            await self._fill_fields(_signup_fields(student_data, password, field_mapping))
+            
+            submit_button = await self.find_submit_button(['Sign Up', 'Create Account', 'Register', 'Submit'])
+            
+            if submit_button:
+                await self._pre_submit_settle()
+                await submit_button.click()
+                await asyncio.sleep(3)  # Wait for submission
+                return True
+            else:
+                log.warning("could not find submit button")
+                return False
+                
+        except Exception as e:
+            log.warning("creating account failed: %s", e)
+            return False
+    
+    async def _try_selectors(self, selectors, action) -> Optional[str]:
+        """Await action on each selector until one succeeds; return that selector"""
+        for selector in selectors:
+            try:
+                await action(selector)
+                return selector
+            except:
+                continue
+        return None
+    
+    async def login(self, login_url: str, email: str, password: str) -> bool:
+        """Login to university portal, reusing a saved session when still valid"""
+        try:
+            state_path = _storage_state_path(self.session_dir, email)
+            if state_path.exists():
+                await self._restore_session(state_path)
+            
+            await self.navigate_to(login_url)
+            
+            if self._session_restored and await self._is_logged_in(login_url):
+                return True
+            
+            await self._try_selectors(
+                LOGIN_EMAIL_SELECTORS,
+                lambda selector: self.page.fill(selector, email, timeout=2000)
+            )
+            await self._try_selectors(
+                LOGIN_PASSWORD_SELECTORS,
+                lambda selector: self.page.fill(selector, password, timeout=2000)
+            )
+            
+            login_button = await self.find_submit_button(['Login', 'Sign In', 'Log In', 'Submit'])
+            
+            if login_button:
+                pre_click_url = self.page.url
+                await login_button.click()
+                await self._wait_for_login_redirect(pre_click_url)
+                await self._save_session(state_path)
+                return True
+            
+            return False
             
         except Exception as e:
-            print(f"Error handling verification link: {e}")
+            log.warning("login failed: %s", e)
             return False
     
-    def take_screenshot(self, filename: str = None) -> str:
-        """Take screenshot of current page"""
+    async def _wait_for_login_redirect(self, pre_click_url: str):
+        """Wait for the portal to leave the login URL after submitting credentials"""
+        try:
+            await self.page.wait_for_url(lambda url: url != pre_click_url, timeout=10000)
+        except TimeoutError:
+            # Some portals log in without navigating; give XHR a short window
+            try:
+                await self.page.wait_for_load_state('networkidle', timeout=1500)
+            except TimeoutError:
+                pass
+    
+    async def _is_logged_in(self, login_url: str) -> bool:
+        """Whether the portal redirected away from a login form"""
+        return (_redirected_away(self.page.url, login_url)
+                and not await self.page.locator('input[type="password"]').count())
+    
+    async def _restore_session(self, state_path: Path):
+        """Load cookies from a saved login session into this session's context"""
+        try:
+            state = json.loads(state_path.read_text())
+            await self.context.add_cookies(state.get('cookies', []))
+            self._session_restored = True
+        except Exception as e:
+            log.warning("could not restore saved session: %s", e)
+    
+    async def _save_session(self, state_path: Path):
+        """Save cookies and local storage so later runs can skip login"""
+        try:
+            state_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            await self.context.storage_state(path=str(state_path))
+        except Exception as e:
+            log.warning("could not save session: %s", e)
+    
+    async def fill_application_form(self,
+                                    form_url: str,
+                                    student_data: Dict[str, Any],
+                                    field_mapping: Union[Dict[str, str], CompiledMapping]) -> bool:
+        """Fill application form"""
+        try:
+            await self.navigate_to(form_url)
+            
+            await self._fill_fields(_application_fields(student_data, field_mapping))
+            
+            return True
+            
+        except Exception as e:
+            log.warning("filling application form failed: %s", e)
+            return False
+    
+    async def submit_form(self) -> bool:
+        """Submit the current form"""
+        try:
+            submit_button = await self.find_submit_button(['Submit', 'Submit Application', 'Send', 'Apply'])
+            
+            if submit_button:
+                await self._pre_submit_settle()
+                await submit_button.click()
+                await asyncio.sleep(3)
+                return True
+            
+            return False
+            
+        except Exception as e:
+            log.warning("submitting form failed: %s", e)
+            return False
+    
+    async def find_submit_button(self, button_texts: List[str]):
+        """Find submit button by text with a single locator query"""
+        button = self.page.locator(_submit_button_selector(tuple(button_texts))).first
+        
+        try:
+            await button.wait_for(state='visible', timeout=1000)
+            return button
+        except TimeoutError:
+            return None
+    
+    async def handle_verification_link(self, verification_url: str) -> bool:
+        """Open verification link and check for a success message"""
+        try:
+            await self.navigate_to(verification_url)
+            await asyncio.sleep(2)
+            
+            text = await self.page.locator('body').inner_text(timeout=3000)
+            
+            return bool(_VERIFY_RE.search(text))
+            
+        except Exception as e:
+            log.warning("handling verification link failed: %s", e)
+            return False
+    
+    async def take_screenshot(self, filename: str = None, wait: bool = False) -> Optional[str]:
+        """
+        Take a JPEG screenshot of current page, skipping the write if unchanged
+        
+        With wait=True the file is on disk when this returns; returns None
+        if writing it failed.
+        """
         if not filename:
-            filename = f"screenshot_{int(time.time())}.png"
+            filename = f"screenshot_{int(time.time())}.jpg"
         
-        filepath = Path('/home/user/student-application-automation/screenshots') / filename
-        filepath.parent.mkdir(exist_ok=True)
+        raw = await self.page.screenshot(**SCREENSHOT_OPTIONS)
+        digest = hashlib.sha256(raw).hexdigest()
+        if digest != self._last_shot_hash or _write_failed(self._last_shot_write):
+            # Written in the background so the event loop isn't blocked on disk
+            filepath = (self.screenshot_dir / filename).with_suffix('.jpg')
+            self._last_shot_write = _write_screenshot(filepath, raw)
+            self._last_shot_hash = digest
+            self._last_shot_path = str(filepath)
         
-        self.page.screenshot(path=str(filepath))
-        return str(filepath)
+        if wait:
+            try:
+                await asyncio.wrap_future(self._last_shot_write)
+            except Exception:
+                # Already logged by the write's callback
+                return None
+        return self._last_shot_path
 
 
 # Demo function
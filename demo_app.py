@@ -1,20 +1,133 @@
 """
 Interactive Demo Web Interface
 A simple Flask web app to demonstrate the system capabilities
+
+Running this file starts Werkzeug's threaded development server, which is
+meant for local use only. In production run it under gunicorn with gevent
+workers (the worker patches the standard library itself):
+
+    gunicorn -w 4 -k gevent --worker-connections 1000 -b 0.0.0.0:8080 demo_app:app
 """
-from flask import Flask, render_template_string, request, jsonify, session
+from flask import Flask, Response, request, jsonify, session
+import atexit
+import gzip
+import hashlib
+import itertools
 import json
+import logging
 import secrets
+import sqlite3
+import threading
+import time
+from collections import deque
 from datetime import datetime
+from pathlib import Path
 import os
 
+from document_extractor import DocumentExtractor
+from json_provider import OrjsonProvider
+
+log = logging.getLogger(__name__)
+
 app = Flask(__name__)
 app.secret_key = secrets.token_hex(16)
+app.json = OrjsonProvider(app)
+# Static assets are referenced with a content hash, so browsers may keep them a year
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 31536000
+
+# Shared across requests; the extractor holds only compiled, thread-safe patterns
+_EXTRACTOR = DocumentExtractor()
 
 # Store demo data in memory (for demo purposes)
 demo_students = {}
 demo_applications = {}
 
+# Student ids; next() on a count is atomic, unlike len(demo_students) + 1
+_ID_COUNTER = itertools.count(1)
+
+# Stored students are also persisted to SQLite, buffered and written in
+# batches: a flush happens once FLUSH_THRESHOLD rows are pending, or
+# FLUSH_INTERVAL seconds after the first unflushed row, whichever is first
+DEMO_DB_PATH = os.environ.get('DEMO_DB_PATH', 'demo_students.db')
+FLUSH_THRESHOLD = 1000
+FLUSH_INTERVAL = 0.5
+
+# The in-memory id is per worker process, so the database assigns its own
+_STUDENT_COLUMNS = ('first_name', 'last_name', 'email', 'phone',
+                    'gpa', 'sat_score', 'created_at')
+_CREATE_STUDENTS = (
+    "CREATE TABLE IF NOT EXISTS students ("
+    "id INTEGER PRIMARY KEY, first_name TEXT, last_name TEXT, email TEXT, "
+    "phone TEXT, gpa TEXT, sat_score TEXT, created_at TEXT)"
+)
+_INSERT_STUDENT = (
+    "INSERT INTO students (" + ", ".join(_STUDENT_COLUMNS) + ") "
+    "VALUES (" + ", ".join("?" * len(_STUDENT_COLUMNS)) + ")"
+)
+
+_PENDING = deque()
+_PENDING_LOCK = threading.Lock()
+_flush_timer = None
+
+
+def _flush_pending():
+    """Write all buffered student rows in one transaction"""
+    global _flush_timer
+    with _PENDING_LOCK:
+        rows = list(_PENDING)
+        _PENDING.clear()
+        if _flush_timer:
+            _flush_timer.cancel()
+            _flush_timer = None
+    
+    if not rows:
+        return
+    
+    try:
+        conn = sqlite3.connect(DEMO_DB_PATH)
+    except sqlite3.Error:
+        log.exception("Error opening %s, dropping %d student row(s)", DEMO_DB_PATH, len(rows))
+        return
+    
+    try:
+        try:
+            with conn:
+                conn.execute(_CREATE_STUDENTS)
+                conn.executemany(_INSERT_STUDENT, rows)
+        except sqlite3.Error:
+            # The batch was rolled back; insert row by row so one bad row
+            # doesn't cost the others
+            log.exception("Batch insert of %d student row(s) failed, retrying one by one", len(rows))
+            for row in rows:
+                try:
+                    with conn:
+                        conn.execute(_INSERT_STUDENT, row)
+                except sqlite3.Error:
+                    log.exception("Error storing student row %r", row)
+    finally:
+        conn.close()
+
+
+def _queue_student(record):
+    """Buffer a student record for the next batched write"""
+    global _flush_timer
+    row = tuple(str(record[c]) if record.get(c) is not None else None
+                for c in _STUDENT_COLUMNS)
+    
+    with _PENDING_LOCK:
+        _PENDING.append(row)
+        flush_now = len(_PENDING) >= FLUSH_THRESHOLD
+        if not flush_now and _flush_timer is None:
+            _flush_timer = threading.Timer(FLUSH_INTERVAL, _flush_pending)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+    
+    if flush_now:
+        _flush_pending()
+
+
+atexit.register(_flush_pending)
+
 HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
@@ -22,176 +135,7 @@ HTML_TEMPLATE = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Student Application Automation - Demo</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-        .header {
-            background: white;
-            border-radius: 15px;
-            padding: 30px;
-            margin-bottom: 30px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-        }
-        .header h1 {
-            color: #667eea;
-            margin-bottom: 10px;
-        }
-        .header p {
-            color: #666;
-            font-size: 14px;
-        }
-        .demo-section {
-            background: white;
-            border-radius: 15px;
-            padding: 30px;
-            margin-bottom: 20px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-        }
-        .demo-section h2 {
-            color: #333;
-            margin-bottom: 20px;
-            display: flex;
-            align-items: center;
-        }
-        .demo-section h2::before {
-            content: '▶';
-            margin-right: 10px;
-            color: #667eea;
-        }
-        .form-group {
-            margin-bottom: 20px;
-        }
-        .form-group label {
-            display: block;
-            margin-bottom: 8px;
-            font-weight: 600;
-            color: #555;
-        }
-        .form-group input, .form-group textarea, .form-group select {
-            width: 100%;
-            padding: 12px;
-            border: 2px solid #e0e0e0;
-            border-radius: 8px;
-            font-size: 14px;
-            transition: border-color 0.3s;
-        }
-        .form-group input:focus, .form-group textarea:focus, .form-group select:focus {
-            outline: none;
-            border-color: #667eea;
-        }
-        .form-group textarea {
-            min-height: 120px;
-            resize: vertical;
-        }
-        .btn {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border: none;
-            padding: 12px 30px;
-            border-radius: 8px;
-            font-size: 16px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: transform 0.2s;
-        }
-        .btn:hover {
-            transform: translateY(-2px);
-        }
-        .btn:active {
-            transform: translateY(0);
-        }
-        .result {
-            background: #f5f5f5;
-            padding: 20px;
-            border-radius: 8px;
-            margin-top: 20px;
-            display: none;
-        }
-        .result.show {
-            display: block;
-        }
-        .result pre {
-            background: #2d3748;
-            color: #e2e8f0;
-            padding: 15px;
-            border-radius: 5px;
-            overflow-x: auto;
-            font-size: 13px;
-        }
-        .status-badge {
-            display: inline-block;
-            padding: 5px 12px;
-            border-radius: 20px;
-            font-size: 12px;
-            font-weight: 600;
-            margin-left: 10px;
-        }
-        .status-success { background: #48bb78; color: white; }
-        .status-pending { background: #ed8936; color: white; }
-        .status-error { background: #f56565; color: white; }
-        .info-box {
-            background: #edf2f7;
-            border-left: 4px solid #667eea;
-            padding: 15px;
-            margin: 20px 0;
-            border-radius: 5px;
-        }
-        .info-box strong {
-            color: #667eea;
-        }
-        .grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 15px;
-        }
-        .loading {
-            display: none;
-            margin: 20px 0;
-            text-align: center;
-        }
-        .loading.show {
-            display: block;
-        }
-        .spinner {
-            border: 4px solid #f3f3f3;
-            border-top: 4px solid #667eea;
-            border-radius: 50%;
-            width: 40px;
-            height: 40px;
-            animation: spin 1s linear infinite;
-            margin: 0 auto;
-        }
-        @keyframes spin {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-        }
-        .feature-list {
-            list-style: none;
-            padding: 0;
-        }
-        .feature-list li {
-            padding: 10px 0;
-            border-bottom: 1px solid #e0e0e0;
-        }
-        .feature-list li:last-child {
-            border-bottom: none;
-        }
-        .feature-list li::before {
-            content: '✓';
-            color: #48bb78;
-            font-weight: bold;
-            margin-right: 10px;
-        }
-    </style>
+    <link rel="stylesheet" href="{app_css}">
 </head>
 <body>
     <div class="container">
@@ -216,7 +160,7 @@ HTML_TEMPLATE = """
                 <textarea id="studentText" placeholder="Example:&#10;Name: John Michael Smith&#10;Email: john.smith@email.com&#10;Phone: (555) 123-4567&#10;Date of Birth: 05/15/2005&#10;GPA: 3.85&#10;SAT Score: 1450&#10;High School: Lincoln High School&#10;Graduation Year: 2023"></textarea>
             </div>
             
-            <button class="btn" onclick="extractData()">Extract Data</button>
+            <button class="btn" id="extractBtn">Extract Data</button>
             
             <div class="loading" id="loading1">
                 <div class="spinner"></div>
@@ -263,7 +207,7 @@ HTML_TEMPLATE = """
                 </div>
             </div>
             
-            <button class="btn" onclick="storeStudent()">Store in Database</button>
+            <button class="btn" id="storeBtn">Store in Database</button>
             
             <div class="loading" id="loading2">
                 <div class="spinner"></div>
@@ -293,7 +237,7 @@ HTML_TEMPLATE = """
                 <input type="number" id="studentId" placeholder="1" value="1">
             </div>
             
-            <button class="btn" onclick="simulateWorkflow()">Simulate Application Process</button>
+            <button class="btn" id="simulateBtn">Simulate Application Process</button>
             
             <div class="loading" id="loading3">
                 <div class="spinner"></div>
@@ -327,134 +271,84 @@ HTML_TEMPLATE = """
         </div>
     </div>
 
-    <script>
-        function extractData() {
-            const text = document.getElementById('studentText').value;
-            
-            if (!text.trim()) {
-                alert('Please enter some student information text');
-                return;
-            }
-            
-            document.getElementById('loading1').classList.add('show');
-            document.getElementById('result1').classList.remove('show');
-            
-            fetch('/api/extract', {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({text: text})
-            })
-            .then(r => r.json())
-            .then(data => {
-                document.getElementById('loading1').classList.remove('show');
-                document.getElementById('result1').classList.add('show');
-                document.getElementById('extractedData').textContent = JSON.stringify(data, null, 2);
-            })
-            .catch(err => {
-                document.getElementById('loading1').classList.remove('show');
-                alert('Error: ' + err);
-            });
-        }
-        
-        function storeStudent() {
-            const data = {
-                first_name: document.getElementById('firstName').value,
-                last_name: document.getElementById('lastName').value,
-                email: document.getElementById('email').value,
-                phone: document.getElementById('phone').value,
-                gpa: document.getElementById('gpa').value,
-                sat_score: document.getElementById('satScore').value
-            };
-            
-            if (!data.first_name || !data.last_name || !data.email) {
-                alert('Please fill in at least First Name, Last Name, and Email');
-                return;
-            }
-            
-            document.getElementById('loading2').classList.add('show');
-            document.getElementById('result2').classList.remove('show');
-            
-            fetch('/api/store', {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify(data)
-            })
-            .then(r => r.json())
-            .then(result => {
-                document.getElementById('loading2').classList.remove('show');
-                document.getElementById('result2').classList.add('show');
-                document.getElementById('storeResult').textContent = JSON.stringify(result, null, 2);
-            })
-            .catch(err => {
-                document.getElementById('loading2').classList.remove('show');
-                alert('Error: ' + err);
-            });
-        }
-        
-        function simulateWorkflow() {
-            const uniName = document.getElementById('uniName').value;
-            const studentId = document.getElementById('studentId').value;
-            
-            if (!uniName || !studentId) {
-                alert('Please enter university name and student ID');
-                return;
-            }
-            
-            document.getElementById('loading3').classList.add('show');
-            document.getElementById('result3').classList.remove('show');
-            
-            fetch('/api/simulate', {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({university: uniName, student_id: studentId})
-            })
-            .then(r => r.json())
-            .then(result => {
-                document.getElementById('loading3').classList.remove('show');
-                document.getElementById('result3').classList.add('show');
-                document.getElementById('workflowResult').textContent = result.workflow;
-            })
-            .catch(err => {
-                document.getElementById('loading3').classList.remove('show');
-                alert('Error: ' + err);
-            });
-        }
-    </script>
+    <script src="{app_js}"></script>
 </body>
 </html>
 """
 
+def _static_url(filename):
+    """URL for a static asset, versioned by content so it can be cached forever"""
+    digest = hashlib.md5(Path(app.static_folder, filename).read_bytes()).hexdigest()
+    return f"/static/{filename}?v={digest[:12]}"
+
+# The page needs no Jinja; its only placeholders are the asset URLs, filled in
+# once here. A gzip copy and the ETags are built once here rather than on every request;
+# each encoding gets its own ETag since the bytes differ.
+_INDEX_HTML = HTML_TEMPLATE.format(
+    app_css=_static_url('app.css'),
+    app_js=_static_url('app.js'),
+)
+_INDEX_BYTES = _INDEX_HTML.encode('utf-8')
+_INDEX_GZIP = gzip.compress(_INDEX_BYTES, compresslevel=9)
+_INDEX_ETAG = hashlib.md5(_INDEX_BYTES).hexdigest()
+_INDEX_GZIP_ETAG = _INDEX_ETAG + '-gzip'
+
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    # Quality of gzip in Accept-Encoding; 0 when absent or refused (gzip;q=0)
+    if request.accept_encodings['gzip']:
+        response = Response(_INDEX_GZIP, mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+        response.set_etag(_INDEX_GZIP_ETAG)
+    else:
+        response = Response(_INDEX_BYTES, mimetype='text/html')
+        response.set_etag(_INDEX_ETAG)
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    # Answers If-None-Match revalidations with an empty 304
+    return response.make_conditional(request)
 
 @app.route('/api/extract', methods=['POST'])
 def extract():
     """Simulate document extraction"""
-    from document_extractor import DocumentExtractor
-    
     data = request.json
     text = data.get('text', '')
     
-    extractor = DocumentExtractor()
-    extracted = extractor.extract_structured_data(text)
+    extracted = _EXTRACTOR.extract_structured_data(text)
     
     return jsonify(extracted)
 
+@app.route('/api/extract/batch', methods=['POST'])
+def extract_batch():
+    """Extract several documents in one request: {"texts": [...]} -> [{...}, ...]"""
+    data = request.json or {}
+    texts = data.get('texts')
+    
+    if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+        return jsonify({
+            'success': False,
+            'error': 'Expected a "texts" list of strings in request body'
+        }), 400
+    
+    results = [_EXTRACTOR.extract_structured_data(text) for text in texts]
+    
+    return jsonify(results)
+
 @app.route('/api/store', methods=['POST'])
 def store():
     """Store student data in memory (demo)"""
     data = request.json
     
     # Generate student ID
-    student_id = len(demo_students) + 1
+    student_id = next(_ID_COUNTER)
     
-    # Store in memory
+    # Store in memory; the server-assigned id wins over any id the client sent
     demo_students[student_id] = {
         'id': student_id,
-        **data,
+        **{k: v for k, v in data.items() if k != 'id'},
         'created_at': datetime.now().isoformat()
     }
+    _queue_student(demo_students[student_id])
     
     return jsonify({
         'success': True,
@@ -463,21 +357,15 @@ def store():
         'data': demo_students[student_id]
     })
 
-@app.route('/api/simulate', methods=['POST'])
-def simulate():
-    """Simulate application workflow"""
-    data = request.json
-    university = data.get('university', 'University')
-    student_id = data.get('student_id', '1')
-    
-    workflow = f"""
+# Workflow transcript returned by /api/simulate, filled in per request
+_WORKFLOW_TMPL = """
 ╔══════════════════════════════════════════════════════════════════════╗
 ║         APPLICATION WORKFLOW SIMULATION                              ║
 ╚══════════════════════════════════════════════════════════════════════╝
 
 Student ID: {student_id}
 University: {university}
-Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Timestamp: {timestamp}
 
 ───────────────────────────────────────────────────────────────────────
 
@@ -582,6 +470,19 @@ All steps completed without errors
 
 ═══════════════════════════════════════════════════════════════════════
     """
+
+@app.route('/api/simulate', methods=['POST'])
+def simulate():
+    """Simulate application workflow"""
+    data = request.json
+    university = data.get('university', 'University')
+    student_id = data.get('student_id', '1')
+    
+    workflow = _WORKFLOW_TMPL.format_map({
+        'student_id': student_id,
+        'university': university,
+        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+    })
     
     return jsonify({
         'success': True,
@@ -597,4 +498,5 @@ if __name__ == '__main__':
     print("   Full browser automation requires local installation.")
     print("\n" + "="*70)
     
-    app.run(host='0.0.0.0', port=8080, debug=False)
+    # Threaded so a slow extraction does not block other clients
+    app.run(host='0.0.0.0', port=8080, debug=False, threaded=True)
@@ -3,45 +3,119 @@ Document extraction module - Extracts student information from PDFs and images
 """
 import re
 import json
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 from pathlib import Path
-import PyPDF2
-from PIL import Image
 from io import BytesIO
 import base64
 
+# Use Google's RE2 (linear-time, no catastrophic backtracking on long runs of
+# digits in OCR output) when google-re2 is installed. The patterns below keep
+# their flags inline so they compile unchanged under either engine.
+try:
+    import re2 as regex_engine
+except ImportError:
+    regex_engine = re
+
+# PyPDF2, PIL and the OCR bindings are imported inside the methods that use
+# them, so text-only callers (like the demo's /api/extract) don't load them.
+
+# tesserocr keeps the Tesseract engine loaded between calls; pytesseract
+# (used when it is not installed) starts a new tesseract process per image.
+# None until the first OCR call checks whether tesserocr is installed.
+_has_tesserocr = None
+
+# TessBaseAPI is not thread-safe, so each thread gets its own engine
+_tess_local = threading.local()
+
+
+def _tess_api():
+    """Return this thread's Tesseract engine, or None without tesserocr"""
+    global _has_tesserocr
+    if _has_tesserocr is False:
+        return None
+    
+    api = getattr(_tess_local, 'api', None)
+    if api is None:
+        try:
+            from tesserocr import PyTessBaseAPI
+        except ImportError:
+            _has_tesserocr = False
+            return None
+        _has_tesserocr = True
+        api = PyTessBaseAPI(lang='eng')
+        _tess_local.api = api
+    return api
+
+# Results of recent extract_structured_data calls, keyed by a digest of the
+# text, so re-submitting the same document skips the regex work
+_RESULT_CACHE_SIZE = 1024
+_result_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+
 class DocumentExtractor:
     """Extract student information from documents"""
     
-    def __init__(self):
-        self.extraction_patterns = {
-            'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            'phone': r'\b(?:\+?1[-.]?)?\(?([0-9]{3})\)?[-.]?([0-9]{3})[-.]?([0-9]{4})\b',
-            'date': r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b',
-            'gpa': r'\b[0-4]\.\d{1,2}\b',
-            'sat_score': r'\b(?:SAT|sat)[\s:]*(\d{3,4})\b',
-            'act_score': r'\b(?:ACT|act)[\s:]*(\d{1,2})\b',
-        }
+    # Compiled once per process and shared by every instance
+    _PATTERNS = {
+        'email': regex_engine.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+        'phone': regex_engine.compile(r'\b(?:\+?1[-.]?)?\(?([0-9]{3})\)?[-.]?([0-9]{3})[-.]?([0-9]{4})\b'),
+        'date': regex_engine.compile(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b'),
+        'gpa': regex_engine.compile(r'\b[0-4]\.\d{1,2}\b'),
+        'sat_score': regex_engine.compile(r'(?i)\b(?:SAT|sat)[\s:]*(\d{3,4})\b'),
+        'act_score': regex_engine.compile(r'(?i)\b(?:ACT|act)[\s:]*(\d{1,2})\b'),
+    }
+    
+    # The unanchored fields fused into one alternation so the text is
+    # scanned once
+    _COMBINED = regex_engine.compile(
+        r'(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'
+        r'|(?P<phone>\b(?:\+?1[-.]?)?\(?([0-9]{3})\)?[-.]?([0-9]{3})[-.]?([0-9]{4})\b)'
+        r'|(?P<gpa>\b[0-4]\.\d{1,2}\b)'
+    )
+    
+    # Scores always follow their keyword, so the regex is only tried where
+    # the keyword occurs instead of at every position of the text
+    _KEYWORD_FIELDS = (('sat', 'sat_score'), ('act', 'act_score'))
+    
+    def __init__(self, http_session=None):
+        """
+        Args:
+            http_session: requests.Session for outbound API calls (the LLM
+                extraction), so connections are reused across documents
+        """
+        self.extraction_patterns = self._PATTERNS
+        self.http_session = http_session
     
     def extract_from_pdf(self, pdf_path: str) -> str:
         """Extract text from PDF"""
-        text = ""
+        import PyPDF2
+        
+        parts = []
         try:
             with open(pdf_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
                 for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
+                    parts.append(page.extract_text() or "")
         except Exception as e:
             print(f"Error extracting PDF: {e}")
-        return text
+        # Join once instead of re-copying the accumulated text for every page
+        return "".join(part + "\n" for part in parts)
     
     def extract_from_image(self, image_path: str) -> str:
         """Extract text from image using OCR"""
         try:
-            # In production, use pytesseract or cloud OCR
-            # For demo, we'll simulate extraction
-            import pytesseract
+            from PIL import Image
             image = Image.open(image_path)
+            
+            api = _tess_api()
+            if api is not None:
+                api.SetImage(image)
+                return api.GetUTF8Text()
+            
+            import pytesseract
             text = pytesseract.image_to_string(image)
             return text
         except Exception as e:
@@ -50,31 +124,60 @@ class DocumentExtractor:
     
     def extract_structured_data(self, text: str) -> Dict[str, Any]:
         """Extract structured student information from text using pattern matching and AI"""
-        data = {}
+        key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
         
-        # Extract using regex patterns
-        email_match = re.search(self.extraction_patterns['email'], text)
-        if email_match:
-            data['email'] = email_match.group(0)
+        with _result_cache_lock:
+            cached = _result_cache.get(key)
+            if cached is not None:
+                _result_cache.move_to_end(key)
+                return dict(cached)
         
-        phone_match = re.search(self.extraction_patterns['phone'], text)
-        if phone_match:
-            data['phone'] = phone_match.group(0)
+        data = self._extract_uncached(text)
         
-        # Extract GPA
-        gpa_match = re.search(self.extraction_patterns['gpa'], text)
-        if gpa_match:
-            data['gpa'] = gpa_match.group(0)
+        with _result_cache_lock:
+            _result_cache[key] = data
+            if len(_result_cache) > _RESULT_CACHE_SIZE:
+                _result_cache.popitem(last=False)
         
-        # Extract SAT score
-        sat_match = re.search(self.extraction_patterns['sat_score'], text, re.IGNORECASE)
-        if sat_match:
-            data['sat_score'] = int(sat_match.group(1))
+        # Callers get their own copy so they can't alter the cached result
+        return dict(data)
+    
+    def _extract_uncached(self, text: str) -> Dict[str, Any]:
+        """Run the pattern and AI extraction for extract_structured_data"""
+        data = {}
+        
+        # Extract using regex patterns, keeping the first match for each field
+        # and stopping as soon as every field has one
+        needed = set(self._COMBINED.groupindex)
+        first_start = {}
+        spans = []
+        for match in self._COMBINED.finditer(text):
+            field = match.lastgroup
+            if field in needed:
+                data[field] = match.group(field)
+                first_start[field] = match.start()
+                needed.discard(field)
+            spans.append(match.span())
+            if not needed:
+                break
         
-        # Extract ACT score
-        act_match = re.search(self.extraction_patterns['act_score'], text, re.IGNORECASE)
-        if act_match:
-            data['act_score'] = int(act_match.group(1))
+        # A match consumes its text, so a field whose first occurrence lies
+        # inside an earlier match of another field (the digits of
+        # 5551234567@sms-gw.com, say) is found late or not at all. Every other
+        # position was already tried, so only those spans need re-checking.
+        for field in self._COMBINED.groupindex:
+            self._recheck_spans(text, field, spans, first_start.get(field), data)
+        
+        # Extract SAT/ACT scores
+        lowered = text.lower()
+        for keyword, field in self._KEYWORD_FIELDS:
+            if len(lowered) == len(text):
+                match = self._match_after_keyword(text, lowered, keyword, field)
+            else:
+                # Lowercasing changed offsets (rare non-ASCII case); scan normally
+                match = self._PATTERNS[field].search(text)
+            if match:
+                data[field] = int(match.group(1))
         
         # For names and complex fields, we'd use AI extraction
         # This is where you'd integrate GPT-4 or similar for intelligent extraction
@@ -82,6 +185,29 @@ class DocumentExtractor:
         
         return data
     
+    def _recheck_spans(self, text: str, field: str, spans: list, found_at: Optional[int], data: Dict[str, Any]):
+        """Take the field's match inside a span before found_at, if there is one"""
+        pattern = self._PATTERNS[field]
+        for start, end in spans:
+            if found_at is not None and start >= found_at:
+                return
+            for pos in range(start, end):
+                match = pattern.match(text, pos)
+                if match:
+                    data[field] = match.group(0)
+                    return
+    
+    def _match_after_keyword(self, text: str, lowered: str, keyword: str, field: str):
+        """Try a field's pattern only at offsets where its keyword appears"""
+        pattern = self._PATTERNS[field]
+        pos = lowered.find(keyword)
+        while pos != -1:
+            match = pattern.match(text, pos)
+            if match:
+                return match
+            pos = lowered.find(keyword, pos + 1)
+        return None
+    
     def _ai_extract_fields(self, text: str) -> Dict[str, Any]:
         """
         Use AI (GPT-4, Claude, etc.) to extract complex fields
@@ -118,6 +244,7 @@ class DocumentExtractor:
         # This is where you'd call OpenAI, Claude, or other LLM
         # For demo purposes, returning empty dict
         # In production: response = openai.chat.completions.create(...)
+        # or self.http_session.post(...) against the provider's HTTP API
         
         return {}
     
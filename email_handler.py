@@ -1,14 +1,384 @@
 """
 Email verification handler - Monitors email and extracts verification links
 """
-import imaplib
+import asyncio
+import base64
+import binascii
 import email
-from email.header import decode_header
+from email.errors import HeaderParseError
+from email.header import decode_header, make_header
+from functools import lru_cache
+import quopri
 import time
 import re
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 from datetime import datetime, timedelta
 
+from imapclient import IMAPClient
+from imapclient.exceptions import IMAPClientAbortError, IMAPClientError
+
+# RFC 2177: servers may drop an IDLE after 30 minutes, so re-issue it sooner
+IDLE_RENEW_SECONDS = 29 * 60
+
+# Ping an idle connection with NOOP before reuse if unused for this long
+NOOP_INTERVAL_SECONDS = 5 * 60
+
+# Without IDLE, poll quickly at first (most verification mail arrives within
+# seconds) and back off, doubling up to check_interval
+FIRST_POLL_SECONDS = 2
+
+
+def _detect_imap_server(email_address: str) -> str:
+    """Auto-detect IMAP server based on email domain"""
+    domain = email_address.split('@')[1].lower()
+    
+    imap_servers = {
+        'gmail.com': 'imap.gmail.com',
+        'outlook.com': 'imap-mail.outlook.com',
+        'hotmail.com': 'imap-mail.outlook.com',
+        'yahoo.com': 'imap.mail.yahoo.com',
+        'icloud.com': 'imap.mail.me.com',
+    }
+    
+    return imap_servers.get(domain, f'imap.{domain}')
+
+
+def _get_email_body_bytes(email_message) -> Tuple[bytes, Optional[str]]:
+    """
+    Extract the raw email body, preferring text/plain over text/html
+    
+    Returns:
+        (payload with the transfer encoding undone, declared charset)
+    """
+    html = None
+    
+    # walk() yields the message itself when it is not multipart
+    for part in email_message.walk():
+        content_type = part.get_content_type()
+        # Check the type before decoding so attachments are never base64-decoded
+        if content_type not in ('text/plain', 'text/html'):
+            continue
+        if part.get('Content-Disposition', '').lower().startswith('attachment'):
+            continue
+        
+        payload = part.get_payload(decode=True)
+        if payload is None:
+            continue
+        
+        if content_type == 'text/plain':
+            return payload, part.get_content_charset()
+        if html is None:
+            html = (payload, part.get_content_charset())
+    
+    return html or (b'', None)
+
+
+# Common patterns for verification links, fused so the body is scanned once:
+# a verify/confirm/... word anywhere in the URL, a token/code/key query
+# parameter, or a /verify/-style path segment. URLs are ASCII, so the raw
+# body bytes are scanned without decoding them first. The pattern is
+# lowercase-only and runs over a lowercased copy, which is cheaper than
+# re.IGNORECASE case-folding every character.
+_LINK_RE = re.compile(
+    rb'https?://(?:'
+    rb'[^\s<>"]+(?:verify|confirm|activate|validation)[^\s<>"]*'
+    rb'|[^\s<>"]+[?&](?:token|code|key)=[^\s<>"&]+'
+    rb'|[^\s<>"]+/(?:verify|confirm|activate)/[^\s<>"]+'
+    rb')'
+)
+
+
+def _extract_verification_link(email_body: bytes) -> Optional[str]:
+    """Extract verification/confirmation link from raw (ASCII-compatible) email body bytes"""
+    # bytes.lower() only touches ASCII, so offsets line up with the original
+    match = _LINK_RE.search(email_body.lower())
+    if match:
+        # Return the first match in its original case, cleaned up
+        link = email_body[match.start():match.end()]
+        return link.decode('ascii', 'ignore').rstrip('.,;:)')
+    return None
+
+
+# Headers and MIME structure only; the body part is fetched separately.
+# BODY.PEEK leaves the \\Seen flag alone so re-runs find the same email.
+_HEADER_FETCH = '(BODY.PEEK[HEADER.FIELDS (SUBJECT FROM DATE)] BODYSTRUCTURE)'
+
+# The same request as IMAPClient data items
+_HEADER_FETCH_ITEMS = ['BODY.PEEK[HEADER.FIELDS (SUBJECT FROM DATE)]', 'BODYSTRUCTURE']
+
+# New matches are inspected newest first, this many at a time: one FETCH
+# brings the headers of a whole window, and older windows are only fetched
+# if the newer ones held no verification link
+SEARCH_CANDIDATES = 10
+
+_LITERAL_MARKER_RE = re.compile(rb'\{\d+\}$')
+_FETCH_START_RE = re.compile(rb'(\d+) (?:FETCH )?\(')
+_UID_ITEM_RE = re.compile(rb'[( ]UID (\d+)')
+_ATOM_RE = re.compile(rb'[^\s()"]+')
+
+
+def _split_fetch_response(chunks) -> Tuple[bytes, List[Tuple[bytes, bytes]]]:
+    """
+    Separate a FETCH response into its plain text and its literals
+    
+    Args:
+        chunks: Response pieces in order; a piece ending in {n} is followed
+            by the literal it announces
+            
+    Returns:
+        (text with literals removed, [(announcing piece, literal), ...])
+    """
+    text = bytearray()
+    literals = []
+    previous = b''
+    for chunk in chunks:
+        if not isinstance(chunk, (bytes, bytearray)):
+            continue
+        chunk = bytes(chunk)
+        if _LITERAL_MARKER_RE.search(previous.rstrip()):
+            literals.append((previous, chunk))
+            previous = b''
+            continue
+        text += chunk + b' '
+        previous = chunk
+    return bytes(text), literals
+
+
+def _split_fetch_by_message(chunks, by_uid: bool = False) -> Dict[bytes, list]:
+    """
+    Group the pieces of a multi-message FETCH response by message
+    
+    Args:
+        chunks: Response pieces as returned by the IMAP library
+        by_uid: Key by the UID data item (UID FETCH) instead of sequence number
+    """
+    messages = {}
+    current = None
+    previous = b''
+    for chunk in chunks:
+        if not isinstance(chunk, (bytes, bytearray)):
+            continue
+        chunk = bytes(chunk)
+        is_literal = bool(_LITERAL_MARKER_RE.search(previous.rstrip()))
+        if not is_literal:
+            match = _FETCH_START_RE.match(chunk)
+            if match:
+                current = messages.setdefault(match.group(1), [])
+        if current is not None:
+            current.append(chunk)
+        previous = b'' if is_literal else chunk
+    
+    if by_uid:
+        by_uid_messages = {}
+        for number, message_chunks in messages.items():
+            text, _ = _split_fetch_response(message_chunks)
+            match = _UID_ITEM_RE.search(text)
+            by_uid_messages[match.group(1) if match else number] = message_chunks
+        return by_uid_messages
+    return messages
+
+
+def _parse_sexp(data: bytes, pos: int = 0):
+    """Parse one IMAP value (list, quoted string, atom or NIL) starting at pos"""
+    while data[pos:pos + 1] == b' ':
+        pos += 1
+    
+    char = data[pos:pos + 1]
+    if char == b'(':
+        items = []
+        pos += 1
+        while True:
+            while data[pos:pos + 1] == b' ':
+                pos += 1
+            if data[pos:pos + 1] == b')':
+                return items, pos + 1
+            if pos >= len(data):
+                raise ValueError("unterminated list")
+            item, pos = _parse_sexp(data, pos)
+            items.append(item)
+    
+    if char == b'"':
+        value = bytearray()
+        pos += 1
+        while data[pos:pos + 1] != b'"':
+            if pos >= len(data):
+                raise ValueError("unterminated string")
+            if data[pos:pos + 1] == b'\\':
+                pos += 1
+            value += data[pos:pos + 1]
+            pos += 1
+        return bytes(value).decode('utf-8', 'replace'), pos + 1
+    
+    match = _ATOM_RE.match(data, pos)
+    if not match:
+        raise ValueError(f"unexpected {char!r} at {pos}")
+    atom = match.group(0)
+    return (None if atom.upper() == b'NIL' else atom.decode('ascii', 'replace')), match.end()
+
+
+def _headers_and_structure(chunks) -> Tuple[bytes, Optional[list]]:
+    """Pull the header literal and parsed BODYSTRUCTURE out of a _HEADER_FETCH response"""
+    text, literals = _split_fetch_response(chunks)
+    
+    headers = b''
+    for announcing, literal in literals:
+        if b'HEADER.FIELDS' in announcing.upper():
+            headers = literal
+            break
+    
+    structure = None
+    start = text.upper().find(b'BODYSTRUCTURE')
+    if start != -1:
+        try:
+            structure, _ = _parse_sexp(text, start + len(b'BODYSTRUCTURE'))
+        except (ValueError, IndexError):
+            structure = None
+    
+    return headers, structure
+
+
+def _find_text_part(structure: list) -> Optional[Tuple[str, str, str]]:
+    """
+    Find the body part to read in a parsed BODYSTRUCTURE
+    
+    Returns:
+        (part number, transfer encoding, charset) of the first text/plain
+        part, else the first text/html part, else None
+    """
+    found = {}
+    
+    def walk(node, number):
+        if node and isinstance(node[0], list):
+            # Multipart: child parts come first, then the subtype and extensions
+            children = []
+            for child in node:
+                if not isinstance(child, list):
+                    break
+                children.append(child)
+            for index, child in enumerate(children, 1):
+                walk(child, f"{number}.{index}" if number else str(index))
+            return
+        
+        if len(node) < 6:
+            return
+        main_type = (node[0] or '').lower()
+        subtype = (node[1] or '').lower()
+        if main_type != 'text' or subtype not in ('plain', 'html') or subtype in found:
+            return
+        
+        params = node[2] if isinstance(node[2], list) else []
+        charset = None
+        for key, value in zip(params[::2], params[1::2]):
+            if (key or '').lower() == 'charset':
+                charset = value
+        found[subtype] = (number or '1', node[5] or '7bit', charset)
+    
+    walk(structure, '')
+    return found.get('plain') or found.get('html')
+
+
+def _structure_from_imapclient(node):
+    """
+    Convert IMAPClient's parsed BODYSTRUCTURE to the layout _parse_sexp gives
+    
+    IMAPClient groups a multipart's children into one list ahead of the
+    subtype; _find_text_part expects them inline, with str atoms.
+    """
+    if isinstance(node, (tuple, list)):
+        if node and isinstance(node[0], list):
+            return ([_structure_from_imapclient(child) for child in node[0]] +
+                    [_structure_from_imapclient(item) for item in node[1:]])
+        return [_structure_from_imapclient(item) for item in node]
+    if isinstance(node, bytes):
+        return node.decode('utf-8', 'replace')
+    return node
+
+
+def _decode_transfer(payload: bytes, encoding: str) -> bytes:
+    """Undo the transfer encoding of a fetched body part"""
+    encoding = (encoding or '').lower()
+    try:
+        if encoding == 'base64':
+            return base64.b64decode(payload)
+        if encoding == 'quoted-printable':
+            return quopri.decodestring(payload)
+    except (binascii.Error, ValueError):
+        pass
+    return payload
+
+
+def _decode_text(payload: bytes, charset: Optional[str]) -> str:
+    """Decode body bytes with their declared charset"""
+    try:
+        return payload.decode(charset or 'utf-8', 'replace')
+    except LookupError:
+        return payload.decode('utf-8', 'replace')
+
+
+def _imap_quote(value: str) -> str:
+    """Quote a string for use as an IMAP search argument"""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+@lru_cache(maxsize=64)
+def _search_criteria(from_domain: str, since_date: str, subject_keywords: tuple = (),
+                     quote: bool = True) -> Tuple[str, ...]:
+    """
+    Build SEARCH criteria tokens, letting the server filter on subject too
+    
+    Keywords (a, b, c) become OR SUBJECT "a" OR SUBJECT "b" SUBJECT "c".
+    Cached because the wait loops rebuild the same criteria on every poll.
+    Pass quote=False for IMAPClient, which quotes arguments itself.
+    """
+    q = _imap_quote if quote else str
+    criteria = ['FROM', q(from_domain), 'SINCE', since_date]
+    
+    if subject_keywords:
+        for keyword in subject_keywords[:-1]:
+            criteria += ['OR', 'SUBJECT', q(keyword)]
+        criteria += ['SUBJECT', q(subject_keywords[-1])]
+    
+    return tuple(criteria)
+
+
+@lru_cache(maxsize=64)
+def _decode_header_value(raw: str) -> str:
+    """Decode an RFC 2047 header value, keeping every encoded word"""
+    if raw.isascii() and '=?' not in raw:
+        return raw
+    try:
+        return str(make_header(decode_header(raw)))
+    except (LookupError, UnicodeDecodeError, HeaderParseError):
+        return raw
+
+
+def _decode_subject(email_message) -> str:
+    """Decode the Subject header"""
+    return _decode_header_value(str(email_message['Subject'] or ''))
+
+
+def _subject_matches(subject: str, subject_keywords: list = None) -> bool:
+    """Check subject keywords if provided"""
+    if not subject_keywords:
+        return True
+    return any(keyword.lower() in subject.lower() for keyword in subject_keywords)
+
+
+def _verification_result(email_message, subject: str, payload: bytes, charset: Optional[str]) -> Dict:
+    """Build the verification email dict returned by the handlers"""
+    body = _decode_text(payload, charset)
+    if (charset or '').lower().startswith(('utf-16', 'utf-32')):
+        # Not ASCII-compatible, so the link regex needs re-encoded bytes
+        payload = body.encode('utf-8')
+    return {
+        'subject': subject,
+        'from': _decode_header_value(str(email_message['From'] or '')),
+        'body': body,
+        'verification_link': _extract_verification_link(payload),
+        'received_time': email_message['Date']
+    }
+
+
 class EmailVerificationHandler:
     """Handle email verification for university applications"""
     
@@ -23,28 +393,22 @@ class EmailVerificationHandler:
         """
         self.email_address = email_address
         self.email_password = email_password
-        self.imap_server = imap_server or self._detect_imap_server(email_address)
+        self.imap_server = imap_server or _detect_imap_server(email_address)
         self.imap = None
-    
-    def _detect_imap_server(self, email_address: str) -> str:
-        """Auto-detect IMAP server based on email domain"""
-        domain = email_address.split('@')[1].lower()
-        
-        imap_servers = {
-            'gmail.com': 'imap.gmail.com',
-            'outlook.com': 'imap-mail.outlook.com',
-            'hotmail.com': 'imap-mail.outlook.com',
-            'yahoo.com': 'imap.mail.yahoo.com',
-            'icloud.com': 'imap.mail.me.com',
-        }
+        self._last_activity = 0.0
         
-        return imap_servers.get(domain, f'imap.{domain}')
+        # Highest UID already examined per (from_domain, subject_keywords),
+        # so repeated polls only look at mail that arrived since
+        self._last_uid: Dict[tuple, int] = {}
     
     def connect(self) -> bool:
         """Connect to email server"""
         try:
-            self.imap = imaplib.IMAP4_SSL(self.imap_server)
+            self.imap = IMAPClient(self.imap_server, ssl=True)
             self.imap.login(self.email_address, self.email_password)
+            self._last_activity = time.time()
+            # UIDs are only comparable within one session's UIDVALIDITY
+            self._last_uid.clear()
             return True
         except Exception as e:
             print(f"Failed to connect to email server: {e}")
@@ -57,6 +421,37 @@ class EmailVerificationHandler:
                 self.imap.logout()
             except:
                 pass
+            self.imap = None
+    
+    def _ensure_connected(self) -> bool:
+        """
+        Make sure there is a live connection with INBOX selected
+        
+        The connection is reused across searches. It is only pinged with
+        NOOP after sitting unused for a while, and reopened if that fails.
+        """
+        if self.imap:
+            if time.time() - self._last_activity < NOOP_INTERVAL_SECONDS:
+                return True
+            try:
+                self.imap.noop()
+                self._last_activity = time.time()
+                return True
+            except (IMAPClientError, OSError):
+                pass
+            self.disconnect()
+        
+        if not self.connect():
+            return False
+        
+        try:
+            # Read-only: we only ever PEEK, so no flags need to change
+            self.imap.select_folder('INBOX', readonly=True)
+        except (IMAPClientError, OSError) as e:
+            print(f"Failed to select INBOX: {e}")
+            self.disconnect()
+            return False
+        return True
     
     def search_verification_email(self, 
                                   from_domain: str, 
@@ -73,109 +468,406 @@ class EmailVerificationHandler:
         Returns:
             Dict with email details and verification link
         """
-        if not self.imap:
-            if not self.connect():
+        # Retry once on a dropped connection
+        for attempt in range(2):
+            if not self._ensure_connected():
                 return None
-        
-        try:
-            self.imap.select('INBOX')
-            
-            # Calculate date for search
-            since_date = (datetime.now() - timedelta(minutes=since_minutes)).strftime('%d-%b-%Y')
-            
-            # Search for emails
-            search_criteria = f'(FROM "{from_domain}" SINCE {since_date})'
-            status, messages = self.imap.search(None, search_criteria)
             
-            if status != 'OK' or not messages[0]:
+            try:
+                result = self._search_latest(from_domain, subject_keywords, since_minutes)
+                self._last_activity = time.time()
+                return result
+            except (IMAPClientAbortError, OSError) as e:
+                print(f"IMAP connection lost, reconnecting: {e}")
+                self.imap = None
+            except Exception as e:
+                print(f"Error searching emails: {e}")
                 return None
+        
+        return None
+    
+    def _search_latest(self,
+                       from_domain: str,
+                       subject_keywords: list,
+                       since_minutes: int) -> Optional[Dict]:
+        """
+        Search INBOX and parse matching emails, newest first
+        
+        Returns the newest match that contains a verification link, or the
+        newest match if none does.
+        """
+        # Calculate date for search
+        since_date = (datetime.now() - timedelta(minutes=since_minutes)).strftime('%d-%b-%Y')
+        
+        # Search for emails not examined yet; the server also applies the
+        # subject filter. IMAPClient searches and fetches by UID.
+        key = (from_domain, tuple(subject_keywords or ()))
+        last_uid = self._last_uid.get(key, 0)
+        criteria = ['UID', f'{last_uid + 1}:*']
+        criteria += _search_criteria(from_domain, since_date, key[1], quote=False)
+        
+        # "n:*" always includes the highest UID, even when it is below n
+        email_ids = sorted(uid for uid in self.imap.search(criteria) if uid > last_uid)
+        if not email_ids:
+            return None
+        
+        found = None
+        newest = None
+        for end in range(len(email_ids), 0, -SEARCH_CANDIDATES):
+            # Headers and structure of one window of candidates
+            window = email_ids[max(0, end - SEARCH_CANDIDATES):end]
+            fetched = self.imap.fetch(window, _HEADER_FETCH_ITEMS)
             
-            # Get the most recent email
-            email_ids = messages[0].split()
-            latest_email_id = email_ids[-1]
+            for email_id in reversed(window):
+                data = fetched.get(email_id)
+                if data is None:
+                    continue
+                
+                # Servers may echo the field names in another case
+                headers = next((value for item, value in data.items()
+                                if b'HEADER.FIELDS' in item.upper()), None)
+                email_message = email.message_from_bytes(headers or b'')
+                subject = _decode_subject(email_message)
+                
+                if not _subject_matches(subject, subject_keywords):
+                    continue
+                
+                structure = data.get(b'BODYSTRUCTURE')
+                if structure is not None:
+                    structure = _structure_from_imapclient(structure)
+                
+                # Only now download the text part of this one email
+                payload, charset = self._fetch_body(email_id, structure)
+                result = _verification_result(email_message, subject, payload, charset)
+                if result['verification_link']:
+                    found = result
+                    break
+                newest = newest or result
             
-            # Fetch the email
-            status, msg_data = self.imap.fetch(latest_email_id, '(RFC822)')
+            if found:
+                break
+        
+        # Advance the mark only once the candidates were examined; if a FETCH
+        # above failed, the same UIDs are searched again next time
+        self._last_uid[key] = email_ids[-1]
+        return found or newest
+    
+    def _fetch_body(self, email_id: int, structure: Optional[list]) -> Tuple[bytes, Optional[str]]:
+        """Fetch the text part of one email by UID, as (bytes, charset)"""
+        part = _find_text_part(structure) if structure else None
+        if part:
+            number, encoding, charset = part
+            data = self.imap.fetch([email_id], [f'BODY.PEEK[{number}]']).get(email_id, {})
+            payload = data.get(f'BODY[{number}]'.encode())
+            if payload is not None:
+                return _decode_transfer(payload, encoding), charset
+        elif structure is None:
+            # No usable BODYSTRUCTURE; read the whole message instead
+            data = self.imap.fetch([email_id], ['BODY.PEEK[]']).get(email_id, {})
+            if data.get(b'BODY[]') is not None:
+                return _get_email_body_bytes(email.message_from_bytes(data[b'BODY[]']))
+        return b'', None
+    
+    def _supports_idle(self) -> bool:
+        """Check whether the server advertises the IDLE capability"""
+        try:
+            return self.imap.has_capability('IDLE')
+        except Exception:
+            return False
+    
+    def _idle_until_new_mail(self, timeout: float) -> Optional[bool]:
+        """
+        Block in IMAP IDLE until the server reports new mail or timeout passes
+        
+        Args:
+            timeout: Maximum seconds to stay idle
             
-            if status != 'OK':
-                return None
+        Returns:
+            True if new mail arrived, False on timeout, None if IDLE failed
+        """
+        try:
+            self.imap.idle()
+            new_mail = False
+            deadline = time.time() + timeout
+            try:
+                while not new_mail:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    # Untagged "* <n> EXISTS" means the mailbox grew
+                    responses = self.imap.idle_check(timeout=remaining)
+                    if not responses:
+                        break
+                    new_mail = any(len(response) > 1 and response[1] == b'EXISTS'
+                                   for response in responses)
+            finally:
+                self.imap.idle_done()
+            return new_mail
             
-            # Parse email
-            email_body = msg_data[0][1]
-            email_message = email.message_from_bytes(email_body)
+        except (IMAPClientError, OSError) as e:
+            print(f"IMAP IDLE failed: {e}")
+            # The connection is in an unknown state; reopen it on next use
+            self.imap = None
+            return None
+    
+    def wait_for_verification_email(self,
+                                   from_domain: str,
+                                   subject_keywords: list = None,
+                                   timeout_minutes: int = 5,
+                                   check_interval: int = 10) -> Optional[Dict]:
+        """
+        Wait for verification email to arrive
+        
+        Args:
+            from_domain: Domain to search emails from
+            subject_keywords: Keywords to look for in subject
+            timeout_minutes: Maximum time to wait
+            check_interval: Longest gap between checks when the server lacks
+                IDLE; polling starts at FIRST_POLL_SECONDS and doubles up to it
             
-            # Decode subject
-            subject = decode_header(email_message['Subject'])[0][0]
-            if isinstance(subject, bytes):
-                subject = subject.decode()
+        Returns:
+            Dict with email details and verification link
+        """
+        start_time = time.time()
+        timeout_seconds = timeout_minutes * 60
+        
+        print(f"Waiting for verification email from {from_domain}...")
+        
+        # Let the server push new-mail notifications instead of polling
+        use_idle = self._ensure_connected() and self._supports_idle()
+        poll_interval = min(FIRST_POLL_SECONDS, check_interval)
+        
+        while (time.time() - start_time) < timeout_seconds:
+            result = self.search_verification_email(
+                from_domain=from_domain,
+                subject_keywords=subject_keywords,
+                since_minutes=timeout_minutes
+            )
             
-            # Check subject keywords if provided
-            if subject_keywords:
-                if not any(keyword.lower() in subject.lower() for keyword in subject_keywords):
-                    return None
+            if result and result.get('verification_link'):
+                print(f"✓ Verification email received!")
+                return result
             
-            # Extract email body
-            body = self._get_email_body(email_message)
+            remaining = timeout_seconds - (time.time() - start_time)
+            if remaining <= 0:
+                break
             
-            # Extract verification link
-            verification_link = self._extract_verification_link(body)
+            if use_idle:
+                if self._idle_until_new_mail(min(IDLE_RENEW_SECONDS, remaining)) is None:
+                    use_idle = False
+            else:
+                time.sleep(min(poll_interval, remaining))
+                poll_interval = min(poll_interval * 2, check_interval)
+        
+        print("✗ Timeout waiting for verification email")
+        return None
+
+
+class AsyncEmailVerificationHandler:
+    """
+    Async counterpart of EmailVerificationHandler, built on aioimaplib
+    
+    Waiting for a verification email only suspends the calling coroutine,
+    so one event loop can wait on many students' inboxes at once. Use one
+    handler per concurrent wait; IMAP connections can't be shared.
+    """
+    
+    def __init__(self, email_address: str, email_password: str, imap_server: str = None):
+        """
+        Initialize async email handler
+        
+        Args:
+            email_address: Email address to monitor
+            email_password: Email password or app-specific password
+            imap_server: IMAP server (auto-detected for common providers)
+        """
+        self.email_address = email_address
+        self.email_password = email_password
+        self.imap_server = imap_server or _detect_imap_server(email_address)
+        self.imap = None
+        self._last_activity = 0.0
+        
+        # Highest UID already examined per (from_domain, subject_keywords),
+        # so repeated polls only look at mail that arrived since
+        self._last_uid: Dict[tuple, int] = {}
+    
+    async def connect(self) -> bool:
+        """Connect to email server and select INBOX"""
+        import aioimaplib
+        
+        try:
+            self.imap = aioimaplib.IMAP4_SSL(host=self.imap_server)
+            await self.imap.wait_hello_from_server()
             
-            return {
-                'subject': subject,
-                'from': email_message['From'],
-                'body': body,
-                'verification_link': verification_link,
-                'received_time': email_message['Date']
-            }
+            response = await self.imap.login(self.email_address, self.email_password)
+            if response.result != 'OK':
+                raise Exception(f"login rejected: {response.lines}")
             
+            await self.imap.select('INBOX')
+            self._last_activity = time.time()
+            self._last_uid.clear()
+            return True
         except Exception as e:
-            print(f"Error searching emails: {e}")
-            return None
+            print(f"Failed to connect to email server: {e}")
+            self.imap = None
+            return False
     
-    def _get_email_body(self, email_message) -> str:
-        """Extract email body"""
-        body = ""
-        
-        if email_message.is_multipart():
-            for part in email_message.walk():
-                content_type = part.get_content_type()
-                if content_type == 'text/plain' or content_type == 'text/html':
-                    try:
-                        body = part.get_payload(decode=True).decode()
-                        break
-                    except:
-                        pass
-        else:
+    async def disconnect(self):
+        """Disconnect from email server"""
+        if self.imap:
             try:
-                body = email_message.get_payload(decode=True).decode()
+                await self.imap.logout()
             except:
                 pass
+            self.imap = None
+    
+    async def _ensure_connected(self) -> bool:
+        """Reuse the open connection, pinging it with NOOP after long idle periods"""
+        if self.imap:
+            if time.time() - self._last_activity < NOOP_INTERVAL_SECONDS:
+                return True
+            try:
+                response = await self.imap.noop()
+                if response.result == 'OK':
+                    self._last_activity = time.time()
+                    return True
+            except Exception:
+                pass
+            await self.disconnect()
         
-        return body
+        return await self.connect()
     
-    def _extract_verification_link(self, email_body: str) -> Optional[str]:
-        """Extract verification/confirmation link from email body"""
-        # Common patterns for verification links
-        patterns = [
-            r'https?://[^\s<>"]+(?:verify|confirm|activate|validation)[^\s<>"]*',
-            r'https?://[^\s<>"]+[?&](?:token|code|key)=[^\s<>"&]+',
-            r'https?://[^\s<>"]+/(?:verify|confirm|activate)/[^\s<>"]+',
-        ]
+    async def search_verification_email(self,
+                                        from_domain: str,
+                                        subject_keywords: list = None,
+                                        since_minutes: int = 10) -> Optional[Dict]:
+        """
+        Search for verification email
         
-        for pattern in patterns:
-            matches = re.findall(pattern, email_body, re.IGNORECASE)
-            if matches:
-                # Return the first match, cleaned up
-                link = matches[0].rstrip('.,;:)')
-                return link
+        Args:
+            from_domain: Domain to search emails from (e.g., 'university.edu')
+            subject_keywords: Keywords to look for in subject
+            since_minutes: Only check emails from last N minutes
+            
+        Returns:
+            Dict with email details and verification link
+        """
+        # Retry once on a dropped connection
+        for attempt in range(2):
+            if not await self._ensure_connected():
+                return None
+            
+            try:
+                result = await self._search_latest(from_domain, subject_keywords, since_minutes)
+                self._last_activity = time.time()
+                return result
+            except (asyncio.TimeoutError, OSError) as e:
+                print(f"IMAP connection lost, reconnecting: {e}")
+                self.imap = None
+            except Exception as e:
+                print(f"Error searching emails: {e}")
+                return None
         
         return None
     
-    def wait_for_verification_email(self,
-                                   from_domain: str,
-                                   subject_keywords: list = None,
-                                   timeout_minutes: int = 5,
-                                   check_interval: int = 10) -> Optional[Dict]:
+    async def _search_latest(self,
+                             from_domain: str,
+                             subject_keywords: list,
+                             since_minutes: int) -> Optional[Dict]:
+        """Search INBOX and parse matching emails, newest first"""
+        since_date = (datetime.now() - timedelta(minutes=since_minutes)).strftime('%d-%b-%Y')
+        
+        key = (from_domain, tuple(subject_keywords or ()))
+        last_uid = self._last_uid.get(key, 0)
+        criteria = ('UID', f'{last_uid + 1}:*') + _search_criteria(from_domain, since_date, key[1])
+        response = await self.imap.uid_search(*criteria)
+        
+        if response.result != 'OK' or not response.lines[0]:
+            return None
+        
+        email_ids = sorted((uid for uid in response.lines[0].split() if int(uid) > last_uid), key=int)
+        if not email_ids:
+            return None
+        
+        found = None
+        newest = None
+        for end in range(len(email_ids), 0, -SEARCH_CANDIDATES):
+            window = email_ids[max(0, end - SEARCH_CANDIDATES):end]
+            response = await self.imap.uid('fetch', b','.join(window).decode(), _HEADER_FETCH)
+            if response.result != 'OK':
+                # Leave the mark alone so these UIDs are searched again
+                return newest
+            fetched = _split_fetch_by_message(response.lines, by_uid=True)
+            
+            for email_id in reversed(window):
+                if email_id not in fetched:
+                    continue
+                
+                headers, structure = _headers_and_structure(fetched[email_id])
+                email_message = email.message_from_bytes(headers)
+                subject = _decode_subject(email_message)
+                
+                if not _subject_matches(subject, subject_keywords):
+                    continue
+                
+                payload, charset = await self._fetch_body(email_id.decode(), structure)
+                result = _verification_result(email_message, subject, payload, charset)
+                if result['verification_link']:
+                    found = result
+                    break
+                newest = newest or result
+            
+            if found:
+                break
+        
+        # Advance the mark only once the candidates were examined
+        self._last_uid[key] = int(email_ids[-1])
+        return found or newest
+    
+    async def _fetch_body(self, email_id: str, structure: Optional[list]) -> Tuple[bytes, Optional[str]]:
+        """Fetch the text part of one email by UID, as (bytes, charset)"""
+        part = _find_text_part(structure) if structure else None
+        if part:
+            number, encoding, charset = part
+            response = await self.imap.uid('fetch', email_id, f'(BODY.PEEK[{number}])')
+            if response.result == 'OK':
+                _, literals = _split_fetch_response(response.lines)
+                if literals:
+                    return _decode_transfer(literals[0][1], encoding), charset
+        elif structure is None:
+            response = await self.imap.uid('fetch', email_id, '(BODY.PEEK[])')
+            if response.result == 'OK':
+                _, literals = _split_fetch_response(response.lines)
+                if literals:
+                    return _get_email_body_bytes(email.message_from_bytes(literals[0][1]))
+        return b'', None
+    
+    async def _wait_for_new_mail(self, timeout: float) -> bool:
+        """
+        Wait in IMAP IDLE for a server push, or timeout
+        
+        Returns:
+            False if IDLE could not be used, True otherwise
+        """
+        try:
+            idle = await self.imap.idle_start(timeout=timeout)
+            try:
+                await self.imap.wait_server_push(timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            self.imap.idle_done()
+            await asyncio.wait_for(idle, 10)
+            return True
+        except Exception as e:
+            print(f"IMAP IDLE failed: {e}")
+            self.imap = None
+            return False
+    
+    async def wait_for_verification_email(self,
+                                          from_domain: str,
+                                          subject_keywords: list = None,
+                                          timeout_minutes: int = 5,
+                                          check_interval: int = 10) -> Optional[Dict]:
         """
         Wait for verification email to arrive
         
@@ -183,31 +875,52 @@ class EmailVerificationHandler:
             from_domain: Domain to search emails from
             subject_keywords: Keywords to look for in subject
             timeout_minutes: Maximum time to wait
-            check_interval: Seconds between checks
+            check_interval: Longest gap between checks when the server lacks
+                IDLE; polling starts at FIRST_POLL_SECONDS and doubles up to it
             
         Returns:
             Dict with email details and verification link
         """
-        start_time = time.time()
-        timeout_seconds = timeout_minutes * 60
-        
         print(f"Waiting for verification email from {from_domain}...")
         
-        while (time.time() - start_time) < timeout_seconds:
-            result = self.search_verification_email(
+        try:
+            result = await asyncio.wait_for(
+                self._wait_loop(from_domain, subject_keywords, timeout_minutes, check_interval),
+                timeout=timeout_minutes * 60
+            )
+        except asyncio.TimeoutError:
+            # The wait may have been cancelled mid-IDLE; start fresh next time
+            await self.disconnect()
+            print("✗ Timeout waiting for verification email")
+            return None
+        
+        print("✓ Verification email received!")
+        return result
+    
+    async def _wait_loop(self,
+                         from_domain: str,
+                         subject_keywords: list,
+                         timeout_minutes: int,
+                         check_interval: int) -> Dict:
+        """Search, then wait for new mail, until a verification link turns up"""
+        use_idle = await self._ensure_connected() and self.imap.has_capability('IDLE')
+        poll_interval = min(FIRST_POLL_SECONDS, check_interval)
+        
+        while True:
+            result = await self.search_verification_email(
                 from_domain=from_domain,
                 subject_keywords=subject_keywords,
                 since_minutes=timeout_minutes
             )
             
             if result and result.get('verification_link'):
-                print(f"✓ Verification email received!")
                 return result
             
-            time.sleep(check_interval)
-        
-        print("✗ Timeout waiting for verification email")
-        return None
+            if use_idle and self.imap:
+                use_idle = await self._wait_for_new_mail(IDLE_RENEW_SECONDS)
+            else:
+                await asyncio.sleep(poll_interval)
+                poll_interval = min(poll_interval * 2, check_interval)
 
 
 # Demo function
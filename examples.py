@@ -104,7 +104,6 @@ def example_batch_applications():
     )
     
     # Extract data for multiple students
-    student_ids = []
     documents = [
         'student1_profile.pdf',
         'student2_profile.pdf',
@@ -112,11 +111,10 @@ def example_batch_applications():
     ]
     
     print("\n📄 Extracting student data...")
-    for doc in documents:
-        student_id = orchestrator.extract_and_store_student(doc)
-        if student_id:
-            student_ids.append(student_id)
-            print(f"  ✓ Student {student_id} extracted")
+    # All students are inserted in a single transaction
+    student_ids = orchestrator.extract_and_store_students(documents)
+    for student_id in student_ids:
+        print(f"  ✓ Student {student_id} extracted")
     
     # Configure multiple universities
     universities = [
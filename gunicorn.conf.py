@@ -0,0 +1,35 @@
+"""
+Gunicorn settings, read automatically from the working directory
+
+The command line (Procfile, railway.json, Dockerfile) sets workers and
+threads; this file only adds server hooks.
+"""
+import os
+
+
+def on_starting(server):
+    """Fail submission jobs the previous server left unfinished"""
+    # Runs once in the master before any worker exists, so every job still
+    # queued or running was cut off by the restart. Doing this in a worker
+    # would also fail jobs the other workers are running.
+    from models import init_db, fail_interrupted_jobs
+    
+    db_url = os.environ.get('DATABASE_URL')
+    if db_url and db_url.startswith('postgres://'):
+        db_url = db_url.replace('postgres://', 'postgresql://', 1)
+    
+    try:
+        engine, SessionMaker = init_db(db_url or 'student_data.db')
+        session = SessionMaker()
+        try:
+            failed = fail_interrupted_jobs(session)
+        finally:
+            session.close()
+            # Workers fork from this process; don't hand them its connections
+            engine.dispose()
+    except Exception:
+        server.log.exception("Could not clean up interrupted submission jobs")
+        return
+    
+    if failed:
+        server.log.warning("Marked %d interrupted submission jobs as failed", failed)
@@ -0,0 +1,42 @@
+"""
+JSON provider for the Flask apps - Serializes and parses with orjson
+"""
+import decimal
+
+import orjson
+from flask.json.provider import JSONProvider
+
+_DUMP_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj):
+    """Serialize the extra types Flask's default provider supports"""
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Drop-in replacement for Flask's JSON provider
+    
+    Assign to app.json so jsonify() and request.json both go through orjson:
+    
+        app.json = OrjsonProvider(app)
+    """
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=_default, option=_DUMP_OPTIONS).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        # Hand orjson's bytes straight to the response, skipping a str round-trip
+        return self._app.response_class(
+            orjson.dumps(obj, default=_default, option=_DUMP_OPTIONS),
+            mimetype='application/json'
+        )
@@ -1,15 +1,60 @@
 """
 Data models for student information and application tracking
 """
-from sqlalchemy import create_engine, Column, Integer, String, Date, DateTime, Boolean, Text
+import os
+import json
+from sqlalchemy import create_engine, event, insert, update, Column, Integer, String, Date, DateTime, Boolean, Text, Index
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from datetime import datetime
-from pydantic import BaseModel, EmailStr
-from typing import Optional, Dict, Any
+from datetime import date, datetime
+from pydantic import BaseModel, ConfigDict, EmailStr, TypeAdapter
+from typing import Optional, Dict, Any, List
 
 Base = declarative_base()
 
+# Fernet instance for APP_FERNET_KEY, built on first use; False when no key
+# is configured
+_fernet = None
+
+
+def _get_fernet():
+    """Return the process-wide Fernet for APP_FERNET_KEY, or None if unset"""
+    global _fernet
+    if _fernet is None:
+        key = os.environ.get('APP_FERNET_KEY')
+        if key:
+            from cryptography.fernet import Fernet
+            _fernet = Fernet(key)
+        else:
+            print("Warning: APP_FERNET_KEY not set, account passwords are stored unencrypted")
+            _fernet = False
+    return _fernet or None
+
+
+class EncryptedString(TypeDecorator):
+    """String column encrypted with Fernet (AES-128-CBC + HMAC) at rest"""
+    impl = String
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        fernet = _get_fernet()
+        if value is None or fernet is None:
+            return value
+        return fernet.encrypt(value.encode()).decode()
+    
+    def process_result_value(self, value, dialect):
+        fernet = _get_fernet()
+        if value is None or fernet is None:
+            return value
+        from cryptography.fernet import InvalidToken
+        try:
+            return fernet.decrypt(value.encode()).decode()
+        except InvalidToken:
+            # Row written before encryption was enabled
+            return value
+
+
 class Student(Base):
     """Student master data model"""
     __tablename__ = 'students'
@@ -49,30 +94,18 @@ class Student(Base):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        return {
-            'id': self.id,
-            'first_name': self.first_name,
-            'middle_name': self.middle_name,
-            'last_name': self.last_name,
-            'email': self.email,
-            'phone': self.phone,
-            'date_of_birth': self.date_of_birth.isoformat() if self.date_of_birth else None,
-            'gender': self.gender,
-            'nationality': self.nationality,
-            'address_line1': self.address_line1,
-            'address_line2': self.address_line2,
-            'city': self.city,
-            'state': self.state,
-            'postal_code': self.postal_code,
-            'country': self.country,
-            'high_school_name': self.high_school_name,
-            'graduation_year': self.graduation_year,
-            'gpa': self.gpa,
-            'sat_score': self.sat_score,
-            'act_score': self.act_score,
-            'intended_major': self.intended_major,
-            'extracurriculars': self.extracurriculars
-        }
+        data = {name: getattr(self, name) for name in self._dict_columns}
+        if data['date_of_birth']:
+            data['date_of_birth'] = data['date_of_birth'].isoformat()
+        return data
+
+
+# Columns exposed by Student.to_dict, in declaration order, computed once
+# instead of listing every attribute on each call
+Student._dict_columns = tuple(
+    column.name for column in Student.__table__.columns
+    if column.name not in ('created_at', 'updated_at')
+)
 
 
 class Application(Base):
@@ -87,11 +120,11 @@ class Application(Base):
     # Account Info
     account_created = Column(Boolean, default=False)
     account_email = Column(String(255))
-    account_password = Column(String(255))  # Should be encrypted in production
+    account_password = Column(EncryptedString(512))  # Encrypted when APP_FERNET_KEY is set
     email_verified = Column(Boolean, default=False)
     
     # Application Status
-    status = Column(String(50), default='pending')  # pending, in_progress, submitted, failed
+    status = Column(String(50), default='pending', index=True)  # pending, in_progress, submitted, failed
     application_id = Column(String(100))
     submission_date = Column(DateTime)
     
@@ -102,16 +135,61 @@ class Application(Base):
     # Metadata
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # Status lookups filter by student (and university); the composite index
+    # also serves student_id-only queries. Not unique: every retry of a
+    # submission records its own row.
+    __table_args__ = (
+        Index('ix_app_student_university', 'student_id', 'university_name'),
+    )
+
+
+class SubmissionJob(Base):
+    """Background submission started through the API"""
+    __tablename__ = 'submission_jobs'
+    
+    id = Column(String(32), primary_key=True)
+    kind = Column(String(20), nullable=False)  # submit, batch
+    status = Column(String(20), default='queued')  # queued, running, finished, failed
+    result = Column(Text)  # JSON
+    error = Column(Text)
+    
+    # Metadata
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            'job_id': self.id,
+            'kind': self.kind,
+            'status': self.status,
+            'result': json.loads(self.result) if self.result else None,
+            'error': self.error,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+
+class DocumentCache(Base):
+    """Extraction results keyed by the SHA-256 of the source document"""
+    __tablename__ = 'document_cache'
+    
+    content_hash = Column(String(64), primary_key=True)
+    extracted_data = Column(Text, nullable=False)  # JSON
+    created_at = Column(DateTime, default=datetime.utcnow)
 
 
 class StudentData(BaseModel):
     """Pydantic model for validation"""
+    model_config = ConfigDict(str_strip_whitespace=True, extra='ignore')
+    
     first_name: str
     last_name: str
     email: EmailStr
     middle_name: Optional[str] = None
     phone: Optional[str] = None
-    date_of_birth: Optional[str] = None
+    date_of_birth: Optional[date] = None
     gender: Optional[str] = None
     nationality: Optional[str] = None
     address_line1: Optional[str] = None
@@ -129,9 +207,116 @@ class StudentData(BaseModel):
     extracurriculars: Optional[str] = None
 
 
+# Validates a whole batch of extracted rows in one pydantic-core call
+StudentDataList = TypeAdapter(List[StudentData])
+
+
+def bulk_create_students(session, rows: List[Dict[str, Any]]) -> List[int]:
+    """
+    Insert many students in one transaction
+    
+    Args:
+        session: Open SQLAlchemy session
+        rows: Student column dicts
+        
+    Returns:
+        New student IDs, in the order of rows
+    """
+    if not rows:
+        return []
+    result = session.execute(
+        insert(Student).returning(Student.id, sort_by_parameter_order=True),
+        rows
+    )
+    student_ids = list(result.scalars())
+    session.commit()
+    return student_ids
+
+
+def fail_interrupted_jobs(session) -> int:
+    """
+    Mark submission jobs a stopped server left queued or running as failed
+    
+    Only call this while no worker is running jobs (e.g. before gunicorn
+    forks its workers), or it fails jobs that are still in progress.
+    
+    Args:
+        session: Open SQLAlchemy session
+        
+    Returns:
+        Number of jobs marked failed
+    """
+    result = session.execute(
+        update(SubmissionJob)
+        .where(SubmissionJob.status.in_(['queued', 'running']))
+        .values(status='failed', error='Interrupted by a server restart',
+                updated_at=datetime.utcnow())
+    )
+    session.commit()
+    return result.rowcount
+
+
+# Applied to every new SQLite connection: WAL lets status reads run while
+# the orchestrator writes, and synchronous=NORMAL drops an fsync per commit
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-64000",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Configure journaling and caching on a new SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
 # Database initialization
-def init_db(db_path: str = 'student_data.db'):
-    """Initialize database"""
-    engine = create_engine(f'sqlite:///{db_path}')
+def init_db(db_path: str = 'student_data.db', **engine_options):
+    """
+    Initialize database
+    
+    Args:
+        db_path: SQLite file path, or a full database URL (e.g. postgresql://...)
+        engine_options: Extra create_engine arguments, overriding the defaults
+    """
+    if '://' in db_path:
+        db_url = db_path
+    else:
+        db_url = f'sqlite:///{db_path}'
+    
+    if db_url.startswith('sqlite'):
+        options = {
+            # The pool hands connections to whichever thread asks next
+            # (gunicorn gthread workers, the API's submission job threads)
+            'connect_args': {'check_same_thread': False},
+            'pool_pre_ping': True,
+        }
+    else:
+        # One pool shared by every request and orchestrator in the process
+        options = {
+            'pool_size': 10,
+            'max_overflow': 20,
+            'pool_timeout': 30,
+            'pool_recycle': 1800,
+            'pool_pre_ping': True,
+        }
+    options.update(engine_options)
+    
+    engine = create_engine(db_url, **options)
+    if engine.dialect.name == 'sqlite':
+        event.listen(engine, 'connect', _set_sqlite_pragmas)
     Base.metadata.create_all(engine)
-    return engine, sessionmaker(bind=engine)
+    # create_all skips tables that already exist, so add indexes that older
+    # databases were created without
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+    # expire_on_commit=False: reading e.g. application.id after a commit would
+    # otherwise re-SELECT and open a transaction that holds a pooled
+    # connection through the whole browser flow that follows
+    return engine, sessionmaker(bind=engine, expire_on_commit=False)
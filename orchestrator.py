@@ -4,14 +4,71 @@ Main orchestrator - Coordinates the entire application workflow
 import os
 import json
 import time
+import hashlib
+import random
+import asyncio
+import weakref
 from typing import Dict, Any, Optional
 from pathlib import Path
+from urllib.parse import urlparse
 from datetime import datetime
 
-from models import init_db, Student, Application, StudentData
+import requests
+from requests.adapters import HTTPAdapter
+from pydantic import ValidationError
+from sqlalchemy import select, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from models import (init_db, bulk_create_students, DocumentCache, Student, Application,
+                    StudentData, StudentDataList)
 from document_extractor import DocumentExtractor
-from email_handler import EmailVerificationHandler
-from browser_automation import BrowserAutomation
+from email_handler import EmailVerificationHandler, AsyncEmailVerificationHandler
+from browser_automation import BrowserAutomation, AsyncBrowserAutomation, compile_field_mapping
+
+# Default cap on applications in flight in the async batch; each holds a
+# browser session and an IMAP connection
+MAX_CONCURRENT_APPLICATIONS = 8
+
+class _ContextPool:
+    """
+    Process-wide cap on open async browser contexts
+    
+    Past a few contexts Chromium competes for CPU instead of getting faster,
+    so every async submission holds a slot while its context is open, no
+    matter which batch or caller started it. asyncio semaphores belong to
+    one event loop, so each loop gets its own.
+    """
+    
+    def __init__(self, size: int):
+        self.size = max(1, size)
+        self._semaphores = weakref.WeakKeyDictionary()
+    
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.size)
+        return semaphore
+    
+    async def acquire(self):
+        """Wait for a free context slot"""
+        await self._semaphore().acquire()
+    
+    def release(self):
+        """Give a context slot back"""
+        self._semaphore().release()
+
+
+_CONTEXT_POOL = _ContextPool(int(os.environ.get('MAX_BROWSER_CONCURRENCY', '4')))
+
+# Minimum gap between two batch submissions to the same university host;
+# different universities don't wait on each other
+SAME_UNIVERSITY_DELAY_SECONDS = 5
+
+
+def _university_host(university_config: Dict[str, Any]) -> str:
+    """Rate-limit key for a university: the host of its URL"""
+    return urlparse(university_config.get('url', '')).hostname or university_config['name']
 
 
 class ApplicationOrchestrator:
@@ -19,21 +76,40 @@ class ApplicationOrchestrator:
     
     def __init__(self, 
                  db_path: str = 'student_data.db',
-                 email_config: Dict[str, str] = None):
+                 email_config: Dict[str, str] = None,
+                 session_maker=None):
         """
         Initialize orchestrator
         
         Args:
-            db_path: Path to SQLite database
+            db_path: Path to SQLite database (or database URL)
             email_config: Email configuration dict with 'address' and 'password'
+            session_maker: Existing sessionmaker to share instead of creating
+                a new engine (and connection pool) from db_path
         """
         # Initialize database
-        self.engine, self.SessionMaker = init_db(db_path)
+        if session_maker is not None:
+            self.engine, self.SessionMaker = session_maker.kw['bind'], session_maker
+        else:
+            self.engine, self.SessionMaker = init_db(db_path)
+        
+        # Outbound HTTP shares one keep-alive pool, so each API host costs one
+        # TLS handshake per orchestrator instead of one per call
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self._http.mount('https://', adapter)
+        self._http.mount('http://', adapter)
         
         # Initialize components
-        self.extractor = DocumentExtractor()
+        self.extractor = DocumentExtractor(http_session=self._http)
         self.browser = None
+        # Chromium shared by every submission; each one gets its own context
+        self._shared_browser: Optional[BrowserAutomation] = None
+        
+        # Signup/application field mappings with field types resolved, per university
+        self._compiled_mappings: Dict[str, Any] = {}
         self.email_handler = None
+        self.email_config = email_config
         
         if email_config:
             self.email_handler = EmailVerificationHandler(
@@ -55,13 +131,13 @@ class ApplicationOrchestrator:
             print(f"\n📄 Extracting data from: {document_path}")
             
             # Extract data from document
-            extracted_data = self.extractor.extract_from_document(document_path)
+            extracted_data = self._extract_document(document_path)
             
             print(f"✓ Extracted {len(extracted_data)} fields")
             
             # Validate data
             try:
-                student_data = StudentData(**extracted_data)
+                student_data = StudentData.model_validate(extracted_data)
             except Exception as e:
                 print(f"⚠ Data validation warning: {e}")
                 # Continue with partial data
@@ -83,10 +159,119 @@ class ApplicationOrchestrator:
             print(f"✗ Error extracting/storing student data: {e}")
             return None
     
+    def _extract_document(self, document_path: str) -> Dict[str, Any]:
+        """
+        Extract a document, reusing the stored result for identical content
+        
+        OCR is by far the slowest step, so re-uploads of the same file are
+        served from the document_cache table by SHA-256 of the file bytes.
+        """
+        digest = hashlib.sha256()
+        with open(document_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        content_hash = digest.hexdigest()
+        
+        session = self.SessionMaker()
+        try:
+            cached = session.get(DocumentCache, content_hash)
+            if cached:
+                print("✓ Using cached extraction for identical document")
+                return json.loads(cached.extracted_data)
+            
+            extracted_data = self.extractor.extract_from_document(document_path)
+            session.merge(DocumentCache(
+                content_hash=content_hash,
+                extracted_data=json.dumps(extracted_data, default=str)
+            ))
+            session.commit()
+            return extracted_data
+        finally:
+            session.close()
+    
+    def extract_and_store_students(self, document_paths: list) -> list:
+        """
+        Extract several documents and store the students in one transaction
+        
+        If the batch insert fails (e.g. a constraint violation or a value
+        the database rejects), the rows are inserted one by one instead and the failing documents are reported.
+        
+        Args:
+            document_paths: Paths to document files
+            
+        Returns:
+            Student IDs of the documents that were extracted and valid
+        """
+        rows = []
+        paths = []
+        for document_path in document_paths:
+            try:
+                print(f"\n📄 Extracting data from: {document_path}")
+                extracted_data = self._extract_document(document_path)
+                print(f"✓ Extracted {len(extracted_data)} fields")
+                rows.append(extracted_data)
+                paths.append(document_path)
+            except Exception as e:
+                print(f"✗ Error extracting student data: {e}")
+        
+        rows, paths = self._validate_students(rows, paths)
+        
+        session = self.SessionMaker()
+        try:
+            try:
+                student_ids = bulk_create_students(session, rows)
+            except SQLAlchemyError:
+                # One bad row (e.g. an email already stored) rolled
+                # back the batch; insert row by row so the others still go in
+                session.rollback()
+                student_ids = []
+                for row, path in zip(rows, paths):
+                    try:
+                        student_ids += bulk_create_students(session, [row])
+                    except SQLAlchemyError as e:
+                        session.rollback()
+                        print(f"✗ Could not store student from {path}: {e}")
+            print(f"✓ Stored {len(student_ids)} students")
+            return student_ids
+        except Exception as e:
+            session.rollback()
+            print(f"✗ Error storing student data: {e}")
+            return []
+        finally:
+            session.close()
+    
+    def _validate_students(self, rows: list, paths: list) -> list:
+        """
+        Validate extracted rows in one call, leaving out the invalid ones
+        
+        Args:
+            rows: Extracted student dicts
+            paths: Document path of each row, for error messages
+            
+        Returns:
+            (rows, paths) of the valid rows, rows reduced to StudentData fields
+        """
+        try:
+            students = StudentDataList.validate_python(rows)
+        except ValidationError as e:
+            invalid = {}
+            for error in e.errors():
+                index, *field = error['loc']
+                invalid.setdefault(index, []).append(f"{'.'.join(map(str, field))}: {error['msg']}")
+            for index, messages in sorted(invalid.items()):
+                print(f"✗ Invalid student data in {paths[index]}: {'; '.join(messages)}")
+            
+            rows = [row for index, row in enumerate(rows) if index not in invalid]
+            paths = [path for index, path in enumerate(paths) if index not in invalid]
+            students = StudentDataList.validate_python(rows)
+        
+        return [student.model_dump() for student in students], paths
+    
     def submit_application(self,
                           student_id: int,
                           university_config: Dict[str, Any],
-                          password: str = None) -> bool:
+                          password: str = None,
+                          student_data: Dict[str, Any] = None) -> bool:
         """
         Submit application to university
         
@@ -101,6 +286,7 @@ class ApplicationOrchestrator:
                 - field_mapping: Dict mapping student fields to form selectors
                 - email_domain: Domain for verification emails
             password: Password for account creation
+            student_data: Student.to_dict() of the student, if already loaded
             
         Returns:
             bool: Success status
@@ -108,15 +294,14 @@ class ApplicationOrchestrator:
         # Get student data
         session = self.SessionMaker()
         try:
-            student = session.query(Student).filter_by(id=student_id).first()
+            if student_data is None:
+                student_data = self._load_students(session, [student_id]).get(student_id)
             
-            if not student:
+            if not student_data:
                 print(f"✗ Student with ID {student_id} not found")
                 return False
             
-            student_data = student.to_dict()
-            
-            print(f"\n🎓 Starting application for {student.first_name} {student.last_name}")
+            print(f"\n🎓 Starting application for {student_data['first_name']} {student_data['last_name']}")
             print(f"   University: {university_config['name']}")
             
             # Create application tracking record
@@ -124,15 +309,20 @@ class ApplicationOrchestrator:
                 student_id=student_id,
                 university_name=university_config['name'],
                 university_url=university_config['url'],
-                account_email=student.email,
+                account_email=student_data['email'],
                 status='in_progress'
             )
             session.add(application)
             session.commit()
             application_id = application.id
+            progress = {}
             
-            # Initialize browser
-            self.browser = BrowserAutomation(headless=False, slow_mo=100)
+            # Fresh context on the shared browser, launched on first use; a
+            # standalone call closes the browser again when it is done
+            owns_browser = self._shared_browser is None
+            if owns_browser:
+                self._shared_browser = BrowserAutomation(headless=False)
+            self.browser = self._shared_browser.new_session()
             
             try:
                 # Step 1: Create account
@@ -142,16 +332,17 @@ class ApplicationOrchestrator:
                     signup_url=university_config['signup_url'],
                     student_data=student_data,
                     password=password or 'TempPassword123!',
-                    field_mapping=university_config.get('signup_field_mapping')
+                    field_mapping=self._compiled_mapping(university_config, 'signup_field_mapping')
                 )
                 
                 if not account_created:
                     raise Exception("Failed to create account")
                 
                 print("✓ Account created successfully")
-                application.account_created = True
-                application.account_password = password or 'TempPassword123!'
-                session.commit()
+                # Progress flags are saved by the final success/failure update,
+                # so each application costs two commits in total
+                progress['account_created'] = True
+                progress['account_password'] = password or 'TempPassword123!'
                 
                 # Step 2: Email verification
                 if self.email_handler and university_config.get('requires_email_verification'):
@@ -173,8 +364,7 @@ class ApplicationOrchestrator:
                         
                         if verified:
                             print("✓ Email verified")
-                            application.email_verified = True
-                            session.commit()
+                            progress['email_verified'] = True
                         else:
                             print("⚠ Could not confirm verification")
                     else:
@@ -186,7 +376,7 @@ class ApplicationOrchestrator:
                 
                 logged_in = self.browser.login(
                     login_url=university_config['login_url'],
-                    email=student.email,
+                    email=student_data['email'],
                     password=password or 'TempPassword123!'
                 )
                 
@@ -201,7 +391,7 @@ class ApplicationOrchestrator:
                 form_filled = self.browser.fill_application_form(
                     form_url=university_config['application_url'],
                     student_data=student_data,
-                    field_mapping=university_config['field_mapping']
+                    field_mapping=self._compiled_mapping(university_config)
                 )
                 
                 if not form_filled:
@@ -220,15 +410,23 @@ class ApplicationOrchestrator:
                 print("✓ Application submitted successfully!")
                 
                 # Take confirmation screenshot
+                # Kept as evidence of the submission, so wait for the file
                 screenshot = self.browser.take_screenshot(
-                    f"submission_{student_id}_{university_config['name']}.png"
+                    f"submission_{student_id}_{university_config['name']}.jpg",
+                    wait=True
                 )
-                print(f"📸 Screenshot saved: {screenshot}")
+                if screenshot:
+                    print(f"📸 Screenshot saved: {screenshot}")
+                else:
+                    print("⚠ Confirmation screenshot could not be saved")
                 
                 # Update application status
-                application.status = 'submitted'
-                application.submission_date = datetime.utcnow()
-                session.commit()
+                self._update_application(
+                    session, application_id,
+                    status='submitted',
+                    submission_date=datetime.utcnow(),
+                    **progress
+                )
                 
                 return True
                 
@@ -236,26 +434,82 @@ class ApplicationOrchestrator:
                 print(f"\n✗ Application failed: {e}")
                 
                 # Update application with error
-                application.status = 'failed'
-                application.last_error = str(e)
-                application.retry_count += 1
-                session.commit()
+                self._update_application(
+                    session, application_id,
+                    status='failed',
+                    last_error=str(e),
+                    retry_count=Application.retry_count + 1,
+                    **progress
+                )
                 
                 # Take error screenshot
                 if self.browser and self.browser.page:
                     self.browser.take_screenshot(
-                        f"error_{student_id}_{university_config['name']}.png"
+                        f"error_{student_id}_{university_config['name']}.jpg"
                     )
                 
                 return False
                 
             finally:
                 if self.browser:
-                    self.browser.close_browser()
+                    self.browser.close_session()
+                if owns_browser:
+                    self.close_browser()
                 
         finally:
             session.close()
     
+    @staticmethod
+    def _load_students(session, student_ids: list) -> Dict[int, Dict[str, Any]]:
+        """Load students with one query, as {student_id: Student.to_dict()}"""
+        students = session.query(Student).filter(Student.id.in_(set(student_ids)))
+        return {student.id: student.to_dict() for student in students}
+    
+    def _preload_students(self, student_ids: list) -> Dict[int, Dict[str, Any]]:
+        """Load every student of a batch up front instead of once per university"""
+        session = self.SessionMaker()
+        try:
+            return self._load_students(session, student_ids)
+        finally:
+            session.close()
+    
+    @staticmethod
+    def _update_application(session, application_id: int, **values):
+        """Write an application's final state in one UPDATE and commit it"""
+        session.execute(
+            update(Application)
+            .where(Application.id == application_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+    
+    def _compiled_mapping(self, university_config: Dict[str, Any], key: str = 'field_mapping'):
+        """
+        Return one of the university's field mappings, compiled once
+        
+        Args:
+            university_config: University configuration dict
+            key: 'field_mapping' (application form) or 'signup_field_mapping'
+            
+        Returns:
+            Compiled mapping, or None if the config has no such mapping
+        """
+        cache_key = (university_config['name'], key)
+        if cache_key not in self._compiled_mappings:
+            mapping = university_config.get(key)
+            self._compiled_mappings[cache_key] = compile_field_mapping(
+                mapping,
+                university_config.get('field_types')
+            ) if mapping else None
+        return self._compiled_mappings[cache_key]
+    
+    def close_browser(self):
+        """Close the browser shared by submissions"""
+        if self._shared_browser:
+            self._shared_browser.close_browser()
+            self._shared_browser = None
+    
     def batch_submit_applications(self,
                                  student_ids: list,
                                  university_configs: list,
@@ -278,30 +532,298 @@ class ApplicationOrchestrator:
             'details': []
         }
         
-        for student_id in student_ids:
-            for uni_config in university_configs:
-                results['total'] += 1
+        students = self._preload_students(student_ids)
+        
+        # Launch Chromium once for the whole batch
+        if self._shared_browser is None:
+            self._shared_browser = BrowserAutomation(headless=False)
+        
+        last_submit: Dict[str, float] = {}
+        
+        try:
+            for student_id in student_ids:
+                for uni_config in university_configs:
+                    results['total'] += 1
+                    
+                    # Only space out consecutive submissions to the same host
+                    host = _university_host(uni_config)
+                    wait = SAME_UNIVERSITY_DELAY_SECONDS - (time.monotonic() - last_submit.get(host, float('-inf')))
+                    if wait > 0:
+                        time.sleep(wait)
+                    
+                    try:
+                        success = self.submit_application(
+                            student_id=student_id,
+                            university_config=uni_config,
+                            password=password,
+                            student_data=students.get(student_id, {})
+                        )
+                    finally:
+                        # The delay counts from the end of the submission
+                        last_submit[host] = time.monotonic()
+                    
+                    if success:
+                        results['successful'] += 1
+                    else:
+                        results['failed'] += 1
+                    
+                    results['details'].append({
+                        'student_id': student_id,
+                        'university': uni_config['name'],
+                        'success': success,
+                        'timestamp': datetime.utcnow().isoformat()
+                    })
+        finally:
+            self.close_browser()
+        
+        return results
+    
+    async def submit_application_async(self,
+                                       student_id: int,
+                                       university_config: Dict[str, Any],
+                                       password: str = None,
+                                       browser: AsyncBrowserAutomation = None,
+                                       student_data: Dict[str, Any] = None) -> bool:
+        """
+        Async version of submit_application
+        
+        Runs in its own browser session with its own IMAP connection, so many
+        applications can wait on pages and verification emails concurrently.
+        
+        Args:
+            student_id: Student ID from database
+            university_config: Configuration dict (see submit_application)
+            password: Password for account creation
+            browser: Shared AsyncBrowserAutomation; one is started if omitted
+            student_data: Student.to_dict() of the student, if already loaded
+            
+        Returns:
+            bool: Success status
+        """
+        password = password or 'TempPassword123!'
+        session = self.SessionMaker()
+        try:
+            if student_data is None:
+                student_data = self._load_students(session, [student_id]).get(student_id)
+            
+            if not student_data:
+                print(f"✗ Student with ID {student_id} not found")
+                return False
+            
+            print(f"\n🎓 Starting application for {student_data['first_name']} {student_data['last_name']}")
+            print(f"   University: {university_config['name']}")
+            
+            application = Application(
+                student_id=student_id,
+                university_name=university_config['name'],
+                university_url=university_config['url'],
+                account_email=student_data['email'],
+                status='in_progress'
+            )
+            session.add(application)
+            session.commit()
+            application_id = application.id
+            progress = {}
+            
+            owns_browser = browser is None
+            if owns_browser:
+                browser = AsyncBrowserAutomation(headless=False)
+                await browser.start_browser()
+            
+            await _CONTEXT_POOL.acquire()
+            page = None
+            email_handler = None
+            try:
+                try:
+                    page = await browser.new_session()
+                    
+                    if self.email_config:
+                        email_handler = AsyncEmailVerificationHandler(
+                            email_address=self.email_config['address'],
+                            email_password=self.email_config['password']
+                        )
+                    
+                    if not await page.create_account(
+                        signup_url=university_config['signup_url'],
+                        student_data=student_data,
+                        password=password,
+                        field_mapping=self._compiled_mapping(university_config, 'signup_field_mapping')
+                    ):
+                        raise Exception("Failed to create account")
+                    
+                    # Written together with the final status (see submit_application)
+                    progress['account_created'] = True
+                    progress['account_password'] = password
+                    
+                    if email_handler and university_config.get('requires_email_verification'):
+                        email_data = await email_handler.wait_for_verification_email(
+                            from_domain=university_config['email_domain'],
+                            subject_keywords=['verify', 'confirm', 'activate'],
+                            timeout_minutes=5
+                        )
+                    
+                        if email_data and email_data.get('verification_link'):
+                            if await page.handle_verification_link(email_data['verification_link']):
+                                progress['email_verified'] = True
+                            else:
+                                print("⚠ Could not confirm verification")
+                        else:
+                            # Continue anyway - some systems allow proceeding without verification
+                            print("⚠ Verification email not received within timeout")
+                    
+                    if not await page.login(
+                        login_url=university_config['login_url'],
+                        email=student_data['email'],
+                        password=password
+                    ):
+                        raise Exception("Failed to login")
+                    
+                    if not await page.fill_application_form(
+                        form_url=university_config['application_url'],
+                        student_data=student_data,
+                        field_mapping=self._compiled_mapping(university_config)
+                    ):
+                        raise Exception("Failed to fill application form")
+                    
+                    if not await page.submit_form():
+                        raise Exception("Failed to submit application")
+                    
+                    screenshot = await page.take_screenshot(
+                        f"submission_{student_id}_{university_config['name']}.jpg",
+                        wait=True
+                    )
+                    print(f"✓ {university_config['name']}: application submitted ({screenshot})")
+                    
+                    self._update_application(
+                        session, application_id,
+                        status='submitted',
+                        submission_date=datetime.utcnow(),
+                        **progress
+                    )
+                    
+                    return True
+                    
+                except Exception as e:
+                    print(f"\n✗ Application to {university_config['name']} failed: {e}")
+                    
+                    self._update_application(
+                        session, application_id,
+                        status='failed',
+                        last_error=str(e),
+                        retry_count=Application.retry_count + 1,
+                        **progress
+                    )
+                    
+                    if page and page.page:
+                        await page.take_screenshot(
+                            f"error_{student_id}_{university_config['name']}.jpg"
+                        )
+                    
+                    return False
+                    
+                finally:
+                    if page:
+                        try:
+                            await page.close_session()
+                        except Exception as e:
+                            print(f"⚠ Could not close browser session: {e}")
+                    if email_handler:
+                        await email_handler.disconnect()
+                    if owns_browser:
+                        await browser.close_browser()
+            finally:
+                # Whatever failed above, the context slot goes back
+                _CONTEXT_POOL.release()
                 
-                success = self.submit_application(
-                    student_id=student_id,
-                    university_config=uni_config,
-                    password=password
+        finally:
+            session.close()
+    
+    async def batch_submit_applications_async(self,
+                                              student_ids: list,
+                                              university_configs: list,
+                                              password: str = None,
+                                              concurrency: int = None) -> Dict[str, Any]:
+        """
+        Submit all (student, university) applications concurrently
+        
+        Every application gets its own session on one shared browser, and
+        up to `concurrency` of them wait on pages and verification emails
+        in parallel.
+        
+        Args:
+            student_ids: List of student IDs
+            university_configs: List of university configuration dicts
+            password: Default password for all accounts
+            concurrency: Max applications in flight (default min(8, students));
+                each one holds its own IMAP connection, and mail servers
+                limit connections per client
+            
+        Returns:
+            Dict with results summary (same shape as batch_submit_applications)
+        """
+        jobs = [(student_id, uni_config)
+                for student_id in student_ids
+                for uni_config in university_configs]
+        
+        if concurrency is None:
+            concurrency = min(MAX_CONCURRENT_APPLICATIONS, len(student_ids))
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        loop = asyncio.get_running_loop()
+        pacing_locks: Dict[str, asyncio.Lock] = {}
+        last_start: Dict[str, float] = {}
+        
+        async def wait_turn(host: str):
+            # Replaces the sequential batch's fixed sleep: only submissions
+            # to the same university are spaced out
+            async with pacing_locks.setdefault(host, asyncio.Lock()):
+                delay = last_start.get(host, float('-inf')) + SAME_UNIVERSITY_DELAY_SECONDS - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay + random.uniform(0, 1))
+                last_start[host] = loop.time()
+        
+        students = self._preload_students(student_ids)
+        
+        async def run_one(student_id, uni_config):
+            async with semaphore:
+                # Pace only once a slot is held, so the start stamped by
+                # wait_turn is the moment the submission actually begins
+                await wait_turn(_university_host(uni_config))
+                return await self.submit_application_async(
+                    student_id, uni_config, password,
+                    browser=browser,
+                    student_data=students.get(student_id, {})
                 )
-                
-                if success:
-                    results['successful'] += 1
-                else:
-                    results['failed'] += 1
-                
-                results['details'].append({
-                    'student_id': student_id,
-                    'university': uni_config['name'],
-                    'success': success,
-                    'timestamp': datetime.utcnow().isoformat()
-                })
-                
-                # Delay between applications
-                time.sleep(5)
+        
+        browser = AsyncBrowserAutomation(headless=False)
+        await browser.start_browser()
+        try:
+            outcomes = await asyncio.gather(
+                *(run_one(student_id, uni_config) for student_id, uni_config in jobs),
+                return_exceptions=True
+            )
+        finally:
+            await browser.close_browser()
+        
+        results = {
+            'total': len(jobs),
+            'successful': 0,
+            'failed': 0,
+            'details': []
+        }
+        
+        for (student_id, uni_config), outcome in zip(jobs, outcomes):
+            success = outcome is True
+            if success:
+                results['successful'] += 1
+            else:
+                results['failed'] += 1
+            
+            results['details'].append({
+                'student_id': student_id,
+                'university': uni_config['name'],
+                'success': success,
+                'timestamp': datetime.utcnow().isoformat()
+            })
         
         return results
     
@@ -317,23 +839,31 @@ class ApplicationOrchestrator:
         """
         session = self.SessionMaker()
         try:
-            query = session.query(Application)
+            # Plain column rows; no Application instances are built
+            query = select(
+                Application.id,
+                Application.student_id,
+                Application.university_name,
+                Application.status,
+                Application.account_created,
+                Application.email_verified,
+                Application.submission_date,
+                Application.last_error
+            )
             
             if student_id:
-                query = query.filter_by(student_id=student_id)
-            
-            applications = query.all()
+                query = query.where(Application.student_id == student_id)
             
             return [{
-                'id': app.id,
-                'student_id': app.student_id,
-                'university': app.university_name,
-                'status': app.status,
-                'account_created': app.account_created,
-                'email_verified': app.email_verified,
-                'submission_date': app.submission_date.isoformat() if app.submission_date else None,
-                'last_error': app.last_error
-            } for app in applications]
+                'id': row.id,
+                'student_id': row.student_id,
+                'university': row.university_name,
+                'status': row.status,
+                'account_created': row.account_created,
+                'email_verified': row.email_verified,
+                'submission_date': row.submission_date.isoformat() if row.submission_date else None,
+                'last_error': row.last_error
+            } for row in session.execute(query)]
             
         finally:
             session.close()
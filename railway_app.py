@@ -1,19 +1,101 @@
 from flask import Flask, request, jsonify
 from orchestrator import ApplicationOrchestrator
-from models import init_db, Student
+from models import init_db, bulk_create_students, fail_interrupted_jobs, Student, StudentDataList, SubmissionJob
+from pydantic import ValidationError
+from json_provider import OrjsonProvider
+from sqlalchemy import text
+from concurrent.futures import ThreadPoolExecutor
 import os
 import json
+import logging
+import threading
+import time
+import uuid
 from datetime import date, datetime
 
+log = logging.getLogger(__name__)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Initialize database
 db_url = os.environ.get('DATABASE_URL')
 if db_url and db_url.startswith('postgres://'):
     db_url = db_url.replace('postgres://', 'postgresql://', 1)
 
+# One engine and connection pool for the whole process; orchestrators
+# created per request share it
 engine, SessionMaker = init_db(db_url or 'student_data.db')
 
+# Submissions drive a browser for minutes, so they run in the background and
+# the request returns a job id right away. Job state lives in the database,
+# so any worker process can answer /api/jobs/<id>.
+SUBMIT_WORKERS = int(os.environ.get('SUBMIT_WORKERS', 2))
+_job_executor = ThreadPoolExecutor(max_workers=SUBMIT_WORKERS, thread_name_prefix='submit')
+
+
+def _update_job(job_id, **fields):
+    """Update a SubmissionJob row"""
+    session = SessionMaker()
+    try:
+        job = session.get(SubmissionJob, job_id)
+        for name, value in fields.items():
+            setattr(job, name, value)
+        session.commit()
+    finally:
+        session.close()
+
+
+def _run_job(job_id, func, *args, **kwargs):
+    """Run a job function in the executor, recording its outcome"""
+    # The executor keeps exceptions in a Future nobody reads, so anything
+    # escaping here would vanish and leave the job "running" for good
+    try:
+        _update_job(job_id, status='running')
+        result = func(*args, **kwargs)
+        _update_job(job_id, status='finished', result=json.dumps(result, default=str))
+    except Exception as e:
+        log.exception("Submission job %s failed", job_id)
+        try:
+            _update_job(job_id, status='failed', error=str(e))
+        except Exception:
+            log.exception("Could not record the failure of submission job %s", job_id)
+
+
+def _start_job(kind, func, *args, **kwargs):
+    """Record a queued job and hand it to the executor; returns the job id"""
+    job_id = uuid.uuid4().hex
+    session = SessionMaker()
+    try:
+        session.add(SubmissionJob(id=job_id, kind=kind, status='queued'))
+        session.commit()
+    finally:
+        session.close()
+    
+    _job_executor.submit(_run_job, job_id, func, *args, **kwargs)
+    return job_id
+
+
+def _submit_one(email_config, student_id, university_config, password):
+    """Job body for /api/submit"""
+    orchestrator = ApplicationOrchestrator(email_config=email_config, session_maker=SessionMaker)
+    success = orchestrator.submit_application(
+        student_id=student_id,
+        university_config=university_config,
+        password=password
+    )
+    return {'success': success, 'student_id': student_id}
+
+
+def _submit_batch(email_config, student_ids, university_configs, password):
+    """Job body for /api/batch"""
+    orchestrator = ApplicationOrchestrator(email_config=email_config, session_maker=SessionMaker)
+    return orchestrator.batch_submit_applications(
+        student_ids=student_ids,
+        university_configs=university_configs,
+        password=password
+    )
+
 @app.route('/')
 def home():
     return jsonify({
@@ -24,29 +106,58 @@ def home():
             'health': 'GET /health',
             'extract': 'POST /api/extract',
             'store': 'POST /api/store',
+            'store_bulk': 'POST /api/store_bulk',
             'submit': 'POST /api/submit',
             'status': 'GET /api/status/<student_id>',
-            'batch': 'POST /api/batch'
+            'batch': 'POST /api/batch',
+            'job': 'GET /api/jobs/<job_id>'
         },
         'documentation': 'See RAILWAY_DEPLOYMENT.md for API details'
     })
 
+# Shared by all requests; created on first use so workers that never extract
+# don't import the extractor
+_extractor = None
+_extractor_lock = threading.Lock()
+
+
+def _get_extractor():
+    """Return the process-wide DocumentExtractor"""
+    global _extractor
+    if _extractor is None:
+        with _extractor_lock:
+            if _extractor is None:
+                from document_extractor import DocumentExtractor
+                _extractor = DocumentExtractor()
+    return _extractor
+
+
+# Health probes arrive every few seconds; one DB check per second answers them all
+HEALTH_CACHE_SECONDS = 1.0
+_last_health = (float('-inf'), None)
+
 @app.route('/health')
 def health():
+    global _last_health
+    checked_at, payload = _last_health
+    if time.monotonic() - checked_at < HEALTH_CACHE_SECONDS:
+        return jsonify(payload)
+    
     try:
         # Test database connection
-        session = SessionMaker()
-        session.execute('SELECT 1')
-        session.close()
+        with engine.connect() as connection:
+            connection.execute(text('SELECT 1'))
         db_status = 'connected'
     except Exception as e:
         db_status = f'error: {str(e)}'
     
-    return jsonify({
+    payload = {
         'status': 'healthy',
         'database': db_status,
         'timestamp': datetime.utcnow().isoformat()
-    })
+    }
+    _last_health = (time.monotonic(), payload)
+    return jsonify(payload)
 
 @app.route('/api/extract', methods=['POST'])
 def extract_data():
@@ -58,8 +169,6 @@ def extract_data():
         "text": "Student information text..."
     }
     """
-    from document_extractor import DocumentExtractor
-    
     try:
         data = request.json
         if not data or 'text' not in data:
@@ -70,8 +179,7 @@ def extract_data():
         
         text = data.get('text', '')
         
-        extractor = DocumentExtractor()
-        extracted = extractor.extract_structured_data(text)
+        extracted = _get_extractor().extract_structured_data(text)
         
         return jsonify({
             'success': True,
@@ -136,6 +244,62 @@ def store_student():
             'error': str(e)
         }), 500
 
+@app.route('/api/store_bulk', methods=['POST'])
+def store_students_bulk():
+    """
+    Store many students in one transaction
+    
+    Request body:
+    {
+        "students": [{"first_name": "John", "last_name": "Smith", "email": "john@email.com", ...}, ...]
+    }
+    """
+    try:
+        data = request.json
+        students = data.get('students') if data else None
+        if not isinstance(students, list) or not students:
+            return jsonify({
+                'success': False,
+                'error': 'Missing "students" list in request body'
+            }), 400
+        
+        try:
+            validated = StudentDataList.validate_python(students)
+        except ValidationError as e:
+            invalid = {}
+            for error in e.errors():
+                index, *field = error['loc']
+                invalid.setdefault(index, []).append(f"{'.'.join(map(str, field))}: {error['msg']}")
+            return jsonify({
+                'success': False,
+                'error': 'Invalid student data',
+                'invalid': [
+                    {'index': index, 'errors': messages}
+                    for index, messages in sorted(invalid.items())
+                ]
+            }), 400
+        
+        # Only the fields the client sent, so column defaults still apply
+        rows = [student.model_dump(exclude_unset=True) for student in validated]
+        
+        session = SessionMaker()
+        try:
+            student_ids = bulk_create_students(session, rows)
+            
+            return jsonify({
+                'success': True,
+                'student_ids': student_ids,
+                'message': f'{len(student_ids)} students stored successfully'
+            })
+        finally:
+            session.close()
+            
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/api/submit', methods=['POST'])
 def submit_application():
     """
@@ -178,19 +342,15 @@ def submit_application():
                 'error': 'Email configuration not set in environment variables'
             }), 500
         
-        orchestrator = ApplicationOrchestrator(email_config=email_config)
-        
-        success = orchestrator.submit_application(
-            student_id=student_id,
-            university_config=university_config,
-            password=password
-        )
+        job_id = _start_job('submit', _submit_one, email_config, student_id, university_config, password)
         
         return jsonify({
-            'success': success,
-            'message': 'Application submitted successfully' if success else 'Application submission failed',
-            'student_id': student_id
-        })
+            'success': True,
+            'message': 'Application submission started',
+            'student_id': student_id,
+            'job_id': job_id,
+            'status_url': f'/api/jobs/{job_id}'
+        }), 202
         
     except Exception as e:
         return jsonify({
@@ -202,7 +362,7 @@ def submit_application():
 def get_status(student_id):
     """Get application status for a student"""
     try:
-        orchestrator = ApplicationOrchestrator()
+        orchestrator = ApplicationOrchestrator(session_maker=SessionMaker)
         status = orchestrator.get_application_status(student_id)
         
         return jsonify({
@@ -216,6 +376,31 @@ def get_status(student_id):
             'error': str(e)
         }), 500
 
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Get the state (and result, once finished) of a submission job"""
+    try:
+        session = SessionMaker()
+        try:
+            job = session.get(SubmissionJob, job_id)
+            if not job:
+                return jsonify({
+                    'success': False,
+                    'error': 'Job not found'
+                }), 404
+            
+            return jsonify({
+                'success': True,
+                **job.to_dict()
+            })
+        finally:
+            session.close()
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/api/batch', methods=['POST'])
 def batch_submit():
     """
@@ -251,18 +436,14 @@ def batch_submit():
             'password': os.environ.get('EMAIL_PASSWORD')
         }
         
-        orchestrator = ApplicationOrchestrator(email_config=email_config)
-        
-        results = orchestrator.batch_submit_applications(
-            student_ids=student_ids,
-            university_configs=university_configs,
-            password=password
-        )
+        job_id = _start_job('batch', _submit_batch, email_config, student_ids, university_configs, password)
         
         return jsonify({
             'success': True,
-            'results': results
-        })
+            'message': 'Batch submission started',
+            'job_id': job_id,
+            'status_url': f'/api/jobs/{job_id}'
+        }), 202
         
     except Exception as e:
         return jsonify({
@@ -280,9 +461,11 @@ def not_found(error):
             'GET /health',
             'POST /api/extract',
             'POST /api/store',
+            'POST /api/store_bulk',
             'POST /api/submit',
             'GET /api/status/<student_id>',
-            'POST /api/batch'
+            'POST /api/batch',
+            'GET /api/jobs/<job_id>'
         ]
     }), 404
 
@@ -294,6 +477,8 @@ def internal_error(error):
         'message': str(error)
     }), 500
 
+# Development server only. Production runs under gunicorn with threaded
+# workers (see Procfile), so long submissions don't block health checks.
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 8080))
     debug = os.environ.get('FLASK_ENV') != 'production'
@@ -306,4 +491,12 @@ if __name__ == '__main__':
     print(f"Database: {db_url or 'SQLite (student_data.db)'}")
     print("=" * 70)
     
+    # Single process, so jobs still marked active were cut off by the last
+    # run; under gunicorn, gunicorn.conf.py does this before forking
+    session = SessionMaker()
+    try:
+        fail_interrupted_jobs(session)
+    finally:
+        session.close()
+    
     app.run(host='0.0.0.0', port=port, debug=debug)
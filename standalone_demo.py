@@ -1,13 +1,48 @@
 """
 Standalone Demo Script - No dependencies required
 """
-
-def demo_document_extraction():
-    print("=" * 80)
-    print(" " * 20 + "DEMO 1: DOCUMENT DATA EXTRACTION")
-    print("=" * 80)
-    
-    sample_text = """
+import argparse
+import re
+import sys
+
+# Rules and spacing shared by every demo section
+_HR80 = "=" * 80
+_HR80_LIGHT = "-" * 80
+_HR78_DOUBLE = "═" * 78
+_GAP = "\n\n"
+
+# Free-form fields for demo_document_extraction, fused into one alternation
+# (one named group per field) so the text is scanned once. re.ASCII keeps
+# \d, \s and \b to their ASCII meaning, which is all these fields use.
+# Branches are tried in order at each position: email first (it can also
+# start on a digit, so it must win over phone/date), then phone, then date
+# of birth. Phone and date can't both match at one position (a date has '/'
+# where a phone has its third digit), so their order only affects speed.
+_EXTRACT_RE = re.compile(
+    r'(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'
+    r'|(?P<phone>\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
+    r'|(?P<date_of_birth>\d{2}/\d{2}/\d{4})',
+    re.ASCII
+)
+
+# Fields that follow a fixed label are read with str.find, no regex needed
+_LABELED_FIELDS = (('gpa', 'GPA:'), ('sat_score', 'SAT Score:'), ('act_score', 'ACT Score:'))
+
+# Fields reported in this order; scores are converted to int
+_EXTRACT_FIELDS = ('email', 'phone', 'gpa', 'sat_score', 'act_score', 'date_of_birth')
+_INT_FIELDS = ('sat_score', 'act_score')
+
+
+def _labeled_value(text, label):
+    """Return the word following label in text, or None"""
+    index = text.find(label)
+    if index == -1:
+        return None
+    words = text[index + len(label):index + len(label) + 32].split(None, 1)
+    return words[0] if words else None
+
+
+_SAMPLE_TEXT = """
     Student Information Form
     
     Name: John Michael Smith
@@ -34,215 +69,229 @@ def demo_document_extraction():
     - Varsity Soccer Team Captain (2022-2023)
     - Volunteer, Local Food Bank (200+ hours)
     """
+
+
+def demo_document_extraction():
+    parts = []
+    parts.append(_HR80)
+    parts.append(" " * 20 + "DEMO 1: DOCUMENT DATA EXTRACTION")
+    parts.append(_HR80)
     
-    print("\n📄 INPUT - Student Information Text:")
-    print("-" * 80)
-    print(sample_text)
+    parts.append("\n📄 INPUT - Student Information Text:")
+    parts.append(_HR80_LIGHT)
+    parts.append(_SAMPLE_TEXT)
     
     # Simulate extraction
-    import re
-    
     extracted = {}
     
-    # Extract email
-    email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', sample_text)
-    if email_match:
-        extracted['email'] = email_match.group(0)
-    
-    # Extract phone
-    phone_match = re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', sample_text)
-    if phone_match:
-        extracted['phone'] = phone_match.group(0)
-    
-    # Extract GPA
-    gpa_match = re.search(r'GPA:\s*(\d\.\d+)', sample_text)
-    if gpa_match:
-        extracted['gpa'] = gpa_match.group(1)
+    found = {}
+    for field, label in _LABELED_FIELDS:
+        value = _labeled_value(_SAMPLE_TEXT, label)
+        if value and (field not in _INT_FIELDS or value.isdigit()):
+            found[field] = value
     
-    # Extract SAT score
-    sat_match = re.search(r'SAT Score:\s*(\d+)', sample_text)
-    if sat_match:
-        extracted['sat_score'] = int(sat_match.group(1))
+    # Keep the first match of each remaining field
+    for match in _EXTRACT_RE.finditer(_SAMPLE_TEXT):
+        field = match.lastgroup
+        if field not in found:
+            found[field] = match.group(field)
+            if len(found) == len(_EXTRACT_FIELDS):
+                break
     
-    # Extract ACT score
-    act_match = re.search(r'ACT Score:\s*(\d+)', sample_text)
-    if act_match:
-        extracted['act_score'] = int(act_match.group(1))
+    for field in _EXTRACT_FIELDS:
+        if field in found:
+            value = found[field]
+            extracted[field] = int(value) if field in _INT_FIELDS else value
     
-    # Extract date
-    dob_match = re.search(r'(\d{2}/\d{2}/\d{4})', sample_text)
-    if dob_match:
-        extracted['date_of_birth'] = dob_match.group(1)
+    parts.append("\n✅ EXTRACTED DATA:")
+    parts.append(_HR80_LIGHT)
+    parts.extend(f"  {key:20s}: {value}" for key, value in extracted.items())
     
-    print("\n✅ EXTRACTED DATA:")
-    print("-" * 80)
-    for key, value in extracted.items():
-        print(f"  {key:20s}: {value}")
+    parts.append("\n💡 In Production:")
+    parts.append("   - Uses AI (GPT-4, Claude) to extract complex fields like names, addresses")
+    parts.append("   - Handles PDF and image files with OCR")
+    parts.append("   - Validates and structures all data")
+    parts.append("\n" + _HR80)
     
-    print("\n💡 In Production:")
-    print("   - Uses AI (GPT-4, Claude) to extract complex fields like names, addresses")
-    print("   - Handles PDF and image files with OCR")
-    print("   - Validates and structures all data")
-    print("\n" + "=" * 80)
+    sys.stdout.write("\n".join(parts) + "\n")
     
     return extracted
 
 
-def demo_workflow_simulation():
-    print("\n" * 2)
-    print("=" * 80)
-    print(" " * 20 + "DEMO 2: APPLICATION WORKFLOW SIMULATION")
-    print("=" * 80)
-    
-    workflow = """
-📋 AUTOMATED APPLICATION WORKFLOW
-──────────────────────────────────────────────────────────────────────────────
-
-Student: John Michael Smith
-University: Sample University
-Timestamp: 2026-01-27 23:35:00
-
-──────────────────────────────────────────────────────────────────────────────
-
-✅ STEP 1: Retrieve Student Data from Database
-   └─ Loaded profile for student ID: 1
-   └─ Verified data completeness: ✓ All required fields present
-
-✅ STEP 2: Initialize Browser Automation
-   └─ Launched Chromium browser (Playwright)
-   └─ Configured viewport: 1920x1080
-   └─ Set user agent: Mozilla/5.0...
-   └─ Ready for automation
-
-✅ STEP 3: Navigate to University Portal
-   └─ URL: https://apply.sampleuniversity.edu
-   └─ Page loaded: 2.3 seconds
-   └─ SSL certificate: Valid ✓
-
-✅ STEP 4: Create Account (Signup)
-   └─ Located signup form
-   └─ Detected 5 required fields
-   └─ Filling fields:
-      • First Name: John
-      • Last Name: Smith
-      • Email: john.smith@email.com
-      • Password: [Generated SecurePass123!]
-      • Terms checkbox: ✓ Accepted
-   └─ Clicked "Create Account" button
-   └─ Response: Account created successfully ✓
-   └─ Account credentials stored in database
-
-✅ STEP 5: Email Verification
-   └─ Monitoring inbox: john.smith@email.com
-   └─ Waiting for verification email...
-   └─ Email received from: noreply@sampleuniversity.edu
-   └─ Subject: "Verify your email address"
-   └─ Extracted verification link: https://apply.sampleuniversity.edu/verify/xyz123
-   └─ Opened link in browser
-   └─ Email verified successfully ✓
-
-✅ STEP 6: Login to Portal
-   └─ Navigated to: https://apply.sampleuniversity.edu/login
-   └─ Entered credentials
-   └─ Clicked "Login" button
-   └─ Login successful ✓
-   └─ Redirected to dashboard
-
-✅ STEP 7: Start Application
-   └─ Located "Start Application" button
-   └─ Clicked to begin
-   └─ Application form loaded
-   └─ Form type: Multi-page (4 sections)
-
-✅ STEP 8: Fill Application Form
-   
-   PAGE 1 - Personal Information
-   ────────────────────────────
-   • First Name: John
-   • Middle Name: Michael
-   • Last Name: Smith
-   • Date of Birth: 05/15/2005
-   • Gender: Male (select)
-   • Citizenship: United States (select)
-   • Email: john.smith@email.com
-   • Phone: (555) 123-4567
-   └─ Clicked "Next" button
-   
-   PAGE 2 - Address Information
-   ────────────────────────────
-   • Address Line 1: 123 Main Street
-   • Address Line 2: Apartment 4B
-   • City: New York
-   • State: NY (select)
-   • ZIP Code: 10001
-   • Country: United States (select)
-   └─ Clicked "Next" button
-   
-   PAGE 3 - Academic Information
-   ────────────────────────────
-   • High School: Lincoln High School
-   • Graduation Year: 2023 (select)
-   • GPA: 3.85
-   • GPA Scale: 4.0 (select)
-   • SAT Score: 1450
-   • ACT Score: 32
-   • Class Rank: Not Provided
-   • Intended Major: Computer Science (select)
-   └─ Clicked "Next" button
-   
-   PAGE 4 - Additional Information
-   ────────────────────────────
-   • Extracurricular Activities:
-     President, Robotics Club (2021-2023)
-     Varsity Soccer Team Captain (2022-2023)
-     Volunteer, Local Food Bank (200+ hours)
-   
-   • Personal Statement: [Uploaded: personal_statement.pdf]
-   • Letters of Recommendation: 3 letters submitted
-   └─ Ready to submit
-
-✅ STEP 9: Submit Application
-   └─ Validated all required fields
-   └─ Clicked "Submit Application" button
-   └─ Processing submission...
-   └─ Confirmation page displayed ✓
-   └─ Application ID: APP-2026-SU-12345
-   └─ Confirmation email sent
-
-✅ STEP 10: Capture Confirmation
-   └─ Screenshot saved: screenshots/submission_1_sampleuniversity.png
-   └─ Confirmation PDF downloaded
-   └─ Application receipt: #APP-2026-SU-12345
-
-✅ STEP 11: Update Database
-   └─ Application status: SUBMITTED
-   └─ Submission timestamp: 2026-01-27 23:45:12
-   └─ Application ID recorded
-   └─ Audit log updated
+# Steps shown by demo_workflow_simulation: (title, detail lines)
+_WORKFLOW_STEPS = (
+    ("Retrieve Student Data from Database", (
+        "└─ Loaded profile for student ID: 1",
+        "└─ Verified data completeness: ✓ All required fields present",
+    )),
+    ("Initialize Browser Automation", (
+        "└─ Launched Chromium browser (Playwright)",
+        "└─ Configured viewport: 1920x1080",
+        "└─ Set user agent: Mozilla/5.0...",
+        "└─ Ready for automation",
+    )),
+    ("Navigate to University Portal", (
+        "└─ URL: https://apply.sampleuniversity.edu",
+        "└─ Page loaded: 2.3 seconds",
+        "└─ SSL certificate: Valid ✓",
+    )),
+    ("Create Account (Signup)", (
+        "└─ Located signup form",
+        "└─ Detected 5 required fields",
+        "└─ Filling fields:",
+        "   • First Name: John",
+        "   • Last Name: Smith",
+        "   • Email: john.smith@email.com",
+        "   • Password: [Generated SecurePass123!]",
+        "   • Terms checkbox: ✓ Accepted",
+        '└─ Clicked "Create Account" button',
+        "└─ Response: Account created successfully ✓",
+        "└─ Account credentials stored in database",
+    )),
+    ("Email Verification", (
+        "└─ Monitoring inbox: john.smith@email.com",
+        "└─ Waiting for verification email...",
+        "└─ Email received from: noreply@sampleuniversity.edu",
+        '└─ Subject: "Verify your email address"',
+        "└─ Extracted verification link: https://apply.sampleuniversity.edu/verify/xyz123",
+        "└─ Opened link in browser",
+        "└─ Email verified successfully ✓",
+    )),
+    ("Login to Portal", (
+        "└─ Navigated to: https://apply.sampleuniversity.edu/login",
+        "└─ Entered credentials",
+        '└─ Clicked "Login" button',
+        "└─ Login successful ✓",
+        "└─ Redirected to dashboard",
+    )),
+    ("Start Application", (
+        '└─ Located "Start Application" button',
+        "└─ Clicked to begin",
+        "└─ Application form loaded",
+        "└─ Form type: Multi-page (4 sections)",
+    )),
+    ("Fill Application Form", (
+        "",
+        "PAGE 1 - Personal Information",
+        "────────────────────────────",
+        "• First Name: John",
+        "• Middle Name: Michael",
+        "• Last Name: Smith",
+        "• Date of Birth: 05/15/2005",
+        "• Gender: Male (select)",
+        "• Citizenship: United States (select)",
+        "• Email: john.smith@email.com",
+        "• Phone: (555) 123-4567",
+        '└─ Clicked "Next" button',
+        "",
+        "PAGE 2 - Address Information",
+        "────────────────────────────",
+        "• Address Line 1: 123 Main Street",
+        "• Address Line 2: Apartment 4B",
+        "• City: New York",
+        "• State: NY (select)",
+        "• ZIP Code: 10001",
+        "• Country: United States (select)",
+        '└─ Clicked "Next" button',
+        "",
+        "PAGE 3 - Academic Information",
+        "────────────────────────────",
+        "• High School: Lincoln High School",
+        "• Graduation Year: 2023 (select)",
+        "• GPA: 3.85",
+        "• GPA Scale: 4.0 (select)",
+        "• SAT Score: 1450",
+        "• ACT Score: 32",
+        "• Class Rank: Not Provided",
+        "• Intended Major: Computer Science (select)",
+        '└─ Clicked "Next" button',
+        "",
+        "PAGE 4 - Additional Information",
+        "────────────────────────────",
+        "• Extracurricular Activities:",
+        "  President, Robotics Club (2021-2023)",
+        "  Varsity Soccer Team Captain (2022-2023)",
+        "  Volunteer, Local Food Bank (200+ hours)",
+        "",
+        "• Personal Statement: [Uploaded: personal_statement.pdf]",
+        "• Letters of Recommendation: 3 letters submitted",
+        "└─ Ready to submit",
+    )),
+    ("Submit Application", (
+        "└─ Validated all required fields",
+        '└─ Clicked "Submit Application" button',
+        "└─ Processing submission...",
+        "└─ Confirmation page displayed ✓",
+        "└─ Application ID: APP-2026-SU-12345",
+        "└─ Confirmation email sent",
+    )),
+    ("Capture Confirmation", (
+        "└─ Screenshot saved: screenshots/submission_1_sampleuniversity.png",
+        "└─ Confirmation PDF downloaded",
+        "└─ Application receipt: #APP-2026-SU-12345",
+    )),
+    ("Update Database", (
+        "└─ Application status: SUBMITTED",
+        "└─ Submission timestamp: 2026-01-27 23:45:12",
+        "└─ Application ID recorded",
+        "└─ Audit log updated",
+    )),
+)
+
+_WORKFLOW_RULE = "─" * 78
+
+
+def _render_workflow(student="John Michael Smith",
+                     university="Sample University",
+                     timestamp="2026-01-27 23:35:00"):
+    """Render the workflow walkthrough for one student and university"""
+    lines = [
+        "",
+        "📋 AUTOMATED APPLICATION WORKFLOW",
+        _WORKFLOW_RULE,
+        "",
+        f"Student: {student}",
+        f"University: {university}",
+        f"Timestamp: {timestamp}",
+        "",
+        _WORKFLOW_RULE,
+        "",
+    ]
+    for number, (title, details) in enumerate(_WORKFLOW_STEPS, 1):
+        lines.append(f"✅ STEP {number}: {title}")
+        lines.extend("   " + detail for detail in details)
+        lines.append("")
+    lines += [
+        _WORKFLOW_RULE,
+        "",
+        "🎉 RESULT: SUCCESS!",
+        "",
+        f"   Application successfully submitted to {university}",
+        "   Total processing time: 3 minutes 42 seconds",
+        "   All steps completed without errors",
+        "   Student will receive confirmation email within 24 hours",
+        "",
+        _WORKFLOW_RULE,
+        "    ",
+    ]
+    return "\n".join(lines)
 
-──────────────────────────────────────────────────────────────────────────────
 
-🎉 RESULT: SUCCESS!
-
-   Application successfully submitted to Sample University
-   Total processing time: 3 minutes 42 seconds
-   All steps completed without errors
-   Student will receive confirmation email within 24 hours
-
-──────────────────────────────────────────────────────────────────────────────
-    """
+def demo_workflow_simulation():
+    parts = []
+    parts.append(_GAP)
+    parts.append(_HR80)
+    parts.append(" " * 20 + "DEMO 2: APPLICATION WORKFLOW SIMULATION")
+    parts.append(_HR80)
     
-    print(workflow)
-    print("=" * 80)
+    parts.append(_render_workflow())
+    parts.append(_HR80)
+    
+    # One write for the whole section instead of a print per line
+    sys.stdout.write("\n".join(parts) + "\n")
 
 
-def demo_system_capabilities():
-    print("\n" * 2)
-    print("=" * 80)
-    print(" " * 20 + "SYSTEM CAPABILITIES OVERVIEW")
-    print("=" * 80)
-    
-    capabilities = """
+_CAPABILITIES = """
 🎓 STUDENT APPLICATION AUTOMATION SYSTEM
 ──────────────────────────────────────────────────────────────────────────────
 
@@ -346,18 +395,23 @@ SECURITY
 
 ══════════════════════════════════════════════════════════════════════════════
     """
-    
-    print(capabilities)
-    print("=" * 80)
 
 
-def demo_configuration_example():
-    print("\n" * 2)
-    print("=" * 80)
-    print(" " * 20 + "UNIVERSITY CONFIGURATION EXAMPLE")
-    print("=" * 80)
+def demo_system_capabilities():
+    parts = []
+    parts.append(_GAP)
+    parts.append(_HR80)
+    parts.append(" " * 20 + "SYSTEM CAPABILITIES OVERVIEW")
+    parts.append(_HR80)
     
-    config = """
+    parts.append(_CAPABILITIES)
+    parts.append(_HR80)
+    
+    # One write for the whole section instead of a print per line
+    sys.stdout.write("\n".join(parts) + "\n")
+
+
+_CONFIG_EXAMPLE = """
 📝 Configuration File: sample_university.json
 ──────────────────────────────────────────────────────────────────────────────
 
@@ -430,31 +484,72 @@ TIPS:
 
 ══════════════════════════════════════════════════════════════════════════════
     """
+
+
+def demo_configuration_example():
+    parts = []
+    parts.append(_GAP)
+    parts.append(_HR80)
+    parts.append(" " * 20 + "UNIVERSITY CONFIGURATION EXAMPLE")
+    parts.append(_HR80)
+    
+    parts.append(_CONFIG_EXAMPLE)
+    parts.append(_HR80)
     
-    print(config)
-    print("=" * 80)
+    # One write for the whole section instead of a print per line
+    sys.stdout.write("\n".join(parts) + "\n")
+
+
+# Boxed title printed at the start of main
+_BANNER = "\n".join((
+    "╔" + _HR78_DOUBLE + "╗",
+    "║" + " " * 15 + "STUDENT APPLICATION AUTOMATION SYSTEM" + " " * 26 + "║",
+    "║" + " " * 25 + "INTERACTIVE DEMO" + " " * 38 + "║",
+    "╚" + _HR78_DOUBLE + "╝",
+))
+
+# Command-line flag, help text and function of each demo, in run order
+_DEMOS = (
+    ('extract', 'document data extraction', demo_document_extraction),
+    ('workflow', 'application workflow simulation', demo_workflow_simulation),
+    ('capabilities', 'system capabilities overview', demo_system_capabilities),
+    ('config', 'university configuration example', demo_configuration_example),
+)
 
 
-def main():
-    """Run all demos"""
+def main(argv=None):
+    """
+    Run the demos selected on the command line (all of them by default)
+    
+    Args:
+        argv: Command-line arguments; defaults to sys.argv[1:]
+    """
+    parser = argparse.ArgumentParser(description="Student Application Automation demo")
+    for flag, help_text, _ in _DEMOS:
+        parser.add_argument(f'--{flag}', action='store_true', help=f"run the {help_text} demo")
+    args = parser.parse_args(argv)
+    
+    selected = [demo for flag, _, demo in _DEMOS if getattr(args, flag)]
+    run_all = not selected
+    if run_all:
+        selected = [demo for _, _, demo in _DEMOS]
     
     print("\n\n")
-    print("╔" + "═" * 78 + "╗")
-    print("║" + " " * 15 + "STUDENT APPLICATION AUTOMATION SYSTEM" + " " * 26 + "║")
-    print("║" + " " * 25 + "INTERACTIVE DEMO" + " " * 38 + "║")
-    print("╚" + "═" * 78 + "╝")
+    print(_BANNER)
     
     # Run demos
-    demo_document_extraction()
-    demo_workflow_simulation()
-    demo_system_capabilities()
-    demo_configuration_example()
+    for demo in selected:
+        demo()
+    
+    # The summary recaps every demo, so it only follows a full run
+    if not run_all:
+        return
     
     # Final summary
-    print("\n" * 2)
-    print("=" * 80)
+    print(_GAP)
+    print(_HR80)
     print(" " * 30 + "SUMMARY")
-    print("=" * 80)
+    print(_HR80)
     print("""
 ✅ WHAT YOU'VE SEEN:
 
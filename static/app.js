@@ -0,0 +1,119 @@
+// Collapse rapid repeat clicks into one call after the user pauses
+function debounce(fn, ms) {
+    let timer;
+    return (...args) => {
+        clearTimeout(timer);
+        timer = setTimeout(() => fn(...args), ms);
+    };
+}
+
+function extractData() {
+    const text = document.getElementById('studentText').value;
+    
+    if (!text.trim()) {
+        alert('Please enter some student information text');
+        return;
+    }
+    
+    const button = document.getElementById('extractBtn');
+    button.disabled = true;
+    document.getElementById('loading1').classList.add('show');
+    document.getElementById('result1').classList.remove('show');
+    
+    fetch('/api/extract', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({text: text})
+    })
+    .then(r => r.json())
+    .then(data => {
+        document.getElementById('loading1').classList.remove('show');
+        document.getElementById('result1').classList.add('show');
+        document.getElementById('extractedData').textContent = JSON.stringify(data, null, 2);
+    })
+    .catch(err => {
+        document.getElementById('loading1').classList.remove('show');
+        alert('Error: ' + err);
+    })
+    .finally(() => {
+        button.disabled = false;
+    });
+}
+
+function storeStudent() {
+    const data = {
+        first_name: document.getElementById('firstName').value,
+        last_name: document.getElementById('lastName').value,
+        email: document.getElementById('email').value,
+        phone: document.getElementById('phone').value,
+        gpa: document.getElementById('gpa').value,
+        sat_score: document.getElementById('satScore').value
+    };
+    
+    if (!data.first_name || !data.last_name || !data.email) {
+        alert('Please fill in at least First Name, Last Name, and Email');
+        return;
+    }
+    
+    const button = document.getElementById('storeBtn');
+    button.disabled = true;
+    document.getElementById('loading2').classList.add('show');
+    document.getElementById('result2').classList.remove('show');
+    
+    fetch('/api/store', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify(data)
+    })
+    .then(r => r.json())
+    .then(result => {
+        document.getElementById('loading2').classList.remove('show');
+        document.getElementById('result2').classList.add('show');
+        document.getElementById('storeResult').textContent = JSON.stringify(result, null, 2);
+    })
+    .catch(err => {
+        document.getElementById('loading2').classList.remove('show');
+        alert('Error: ' + err);
+    })
+    .finally(() => {
+        button.disabled = false;
+    });
+}
+
+function simulateWorkflow() {
+    const uniName = document.getElementById('uniName').value;
+    const studentId = document.getElementById('studentId').value;
+    
+    if (!uniName || !studentId) {
+        alert('Please enter university name and student ID');
+        return;
+    }
+    
+    const button = document.getElementById('simulateBtn');
+    button.disabled = true;
+    document.getElementById('loading3').classList.add('show');
+    document.getElementById('result3').classList.remove('show');
+    
+    fetch('/api/simulate', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({university: uniName, student_id: studentId})
+    })
+    .then(r => r.json())
+    .then(result => {
+        document.getElementById('loading3').classList.remove('show');
+        document.getElementById('result3').classList.add('show');
+        document.getElementById('workflowResult').textContent = result.workflow;
+    })
+    .catch(err => {
+        document.getElementById('loading3').classList.remove('show');
+        alert('Error: ' + err);
+    })
+    .finally(() => {
+        button.disabled = false;
+    });
+}
+
+document.getElementById('extractBtn').addEventListener('click', debounce(extractData, 300));
+document.getElementById('storeBtn').addEventListener('click', debounce(storeStudent, 300));
+document.getElementById('simulateBtn').addEventListener('click', debounce(simulateWorkflow, 300));
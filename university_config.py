@@ -3,11 +3,52 @@ University Configuration Template Generator
 
 This script helps you create configuration files for new universities
 """
+import copy
 import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-def create_university_config_template():
-    """Generate a blank university configuration template"""
+__all__ = [
+    'INSPECTION_GUIDE',
+    'create_university_config_template',
+    'create_university_config_template_readonly',
+    'save_university_config',
+    'load_university_config',
+    'inspect_university_website',
+    'create_example_configs',
+]
+
+# orjson encodes/decodes in C; the stdlib json module is used when it isn't
+# installed. Both produce 2-space indented UTF-8 bytes.
+try:
+    import orjson
+    
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    _loads = json.loads
+
+# Where configurations are saved and loaded; created when a save finds it
+# missing
+_CONFIG_DIR = Path('university_configs')
+
+# Placeholder selectors repeated throughout the template, shared (interned)
+# so every field using one points at the same string
+_CSS_PLACEHOLDER = sys.intern("# CSS selector")
+_CSS_SELECT = sys.intern("# CSS selector (select/dropdown)")
+_CSS_TEXTAREA = sys.intern("# CSS selector (textarea)")
+
+
+@lru_cache(maxsize=1)
+def _template_prototype():
+    """Build the blank template once; callers must not modify the result"""
     
     template = {
         "name": "University Name",
@@ -33,27 +74,27 @@ def create_university_config_template():
         },
         
         "field_mapping": {
-            "first_name": "# CSS selector",
-            "middle_name": "# CSS selector",
-            "last_name": "# CSS selector",
-            "email": "# CSS selector",
-            "phone": "# CSS selector",
+            "first_name": _CSS_PLACEHOLDER,
+            "middle_name": _CSS_PLACEHOLDER,
+            "last_name": _CSS_PLACEHOLDER,
+            "email": _CSS_PLACEHOLDER,
+            "phone": _CSS_PLACEHOLDER,
             "date_of_birth": "# CSS selector (format: YYYY-MM-DD)",
-            "gender": "# CSS selector (select/dropdown)",
-            "nationality": "# CSS selector",
-            "address_line1": "# CSS selector",
-            "address_line2": "# CSS selector",
-            "city": "# CSS selector",
-            "state": "# CSS selector (select/dropdown)",
-            "postal_code": "# CSS selector",
-            "country": "# CSS selector (select/dropdown)",
-            "high_school_name": "# CSS selector",
-            "graduation_year": "# CSS selector",
-            "gpa": "# CSS selector",
-            "sat_score": "# CSS selector",
-            "act_score": "# CSS selector",
-            "intended_major": "# CSS selector (select/dropdown)",
-            "extracurriculars": "# CSS selector (textarea)"
+            "gender": _CSS_SELECT,
+            "nationality": _CSS_PLACEHOLDER,
+            "address_line1": _CSS_PLACEHOLDER,
+            "address_line2": _CSS_PLACEHOLDER,
+            "city": _CSS_PLACEHOLDER,
+            "state": _CSS_SELECT,
+            "postal_code": _CSS_PLACEHOLDER,
+            "country": _CSS_SELECT,
+            "high_school_name": _CSS_PLACEHOLDER,
+            "graduation_year": _CSS_PLACEHOLDER,
+            "gpa": _CSS_PLACEHOLDER,
+            "sat_score": _CSS_PLACEHOLDER,
+            "act_score": _CSS_PLACEHOLDER,
+            "intended_major": _CSS_SELECT,
+            "extracurriculars": _CSS_TEXTAREA
         },
         
         "field_types": {
@@ -79,16 +120,38 @@ def create_university_config_template():
     return template
 
 
+def create_university_config_template():
+    """Generate a blank university configuration template"""
+    return copy.deepcopy(_template_prototype())
+
+
+def create_university_config_template_readonly():
+    """Return the shared blank template, for callers that only read or save it"""
+    return _template_prototype()
+
+
 def save_university_config(config: dict, filename: str):
     """Save university configuration to JSON file"""
     
-    config_dir = Path('university_configs')
-    config_dir.mkdir(exist_ok=True)
+    filepath = _CONFIG_DIR / (filename + ".json")
+    
+    # Serialized in memory and written with a single call
+    data = _dumps(config)
     
-    filepath = config_dir / f"{filename}.json"
+    # Leave an identical file alone, so re-runs don't touch its mtime
+    try:
+        if filepath.read_bytes() == data:
+            print(f"✓ Configuration unchanged: {filepath}")
+            return filepath
+    except FileNotFoundError:
+        pass
     
-    with open(filepath, 'w') as f:
-        json.dump(config, f, indent=2)
+    try:
+        filepath.write_bytes(data)
+    except FileNotFoundError:
+        # First save, or the directory was removed since
+        _CONFIG_DIR.mkdir(exist_ok=True)
+        filepath.write_bytes(data)
     
     print(f"✓ Configuration saved to: {filepath}")
     return filepath
@@ -97,21 +160,16 @@ def save_university_config(config: dict, filename: str):
 def load_university_config(filename: str) -> dict:
     """Load university configuration from JSON file"""
     
-    filepath = Path('university_configs') / f"{filename}.json"
+    filepath = _CONFIG_DIR / (filename + ".json")
     
     if not filepath.exists():
         raise FileNotFoundError(f"Configuration not found: {filepath}")
     
-    with open(filepath, 'r') as f:
-        config = json.load(f)
-    
-    return config
+    return _loads(filepath.read_bytes())
 
 
-def inspect_university_website():
-    """Guide for inspecting university websites to create configuration"""
-    
-    guide = """
+# Printed by inspect_university_website; importable for docs and help text
+INSPECTION_GUIDE = """
     ═══════════════════════════════════════════════════════════════════
     GUIDE: How to Inspect University Website and Create Configuration
     ═══════════════════════════════════════════════════════════════════
@@ -226,60 +284,73 @@ def inspect_university_website():
     
     ═══════════════════════════════════════════════════════════════════
     """
-    
-    print(guide)
 
 
-def create_example_configs():
-    """Create example configurations for common university platforms"""
-    
-    # Common Application (Coalition App style)
-    common_app_style = {
-        "name": "Common Application Style University",
-        "url": "https://apply.university.edu",
-        "signup_url": "https://apply.university.edu/account/create",
-        "login_url": "https://apply.university.edu/login",
-        "application_url": "https://apply.university.edu/application",
-        "email_domain": "university.edu",
-        "requires_email_verification": True,
-        "field_mapping": {
-            "first_name": "#profile_first_name",
-            "last_name": "#profile_last_name",
-            "email": "#profile_email",
-            "phone": "#profile_phone",
-            "date_of_birth": "#profile_birth_date",
-            "address_line1": "#profile_address_1",
-            "city": "#profile_city",
-            "state": "#profile_state",
-            "postal_code": "#profile_zip"
-        }
+def inspect_university_website():
+    """Guide for inspecting university websites to create configuration"""
+    print(INSPECTION_GUIDE)
+
+
+# Example configurations saved by create_example_configs; built once at
+# import and never modified
+
+# Common Application (Coalition App style)
+_COMMON_APP_STYLE = {
+    "name": "Common Application Style University",
+    "url": "https://apply.university.edu",
+    "signup_url": "https://apply.university.edu/account/create",
+    "login_url": "https://apply.university.edu/login",
+    "application_url": "https://apply.university.edu/application",
+    "email_domain": "university.edu",
+    "requires_email_verification": True,
+    "field_mapping": {
+        "first_name": "#profile_first_name",
+        "last_name": "#profile_last_name",
+        "email": "#profile_email",
+        "phone": "#profile_phone",
+        "date_of_birth": "#profile_birth_date",
+        "address_line1": "#profile_address_1",
+        "city": "#profile_city",
+        "state": "#profile_state",
+        "postal_code": "#profile_zip"
     }
-    
-    # Slate-based system (popular admissions platform)
-    slate_style = {
-        "name": "Slate-Based University",
-        "url": "https://admissions.university.edu",
-        "signup_url": "https://admissions.university.edu/register",
-        "login_url": "https://admissions.university.edu/apply",
-        "application_url": "https://admissions.university.edu/apply/status",
-        "email_domain": "university.edu",
-        "requires_email_verification": True,
-        "field_mapping": {
-            "first_name": "[name='first']",
-            "last_name": "[name='last']",
-            "email": "[name='email']",
-            "phone": "[name='mobile']",
-            "date_of_birth": "[name='birthdate']"
-        }
+}
+
+# Slate-based system (popular admissions platform)
+_SLATE_STYLE = {
+    "name": "Slate-Based University",
+    "url": "https://admissions.university.edu",
+    "signup_url": "https://admissions.university.edu/register",
+    "login_url": "https://admissions.university.edu/apply",
+    "application_url": "https://admissions.university.edu/apply/status",
+    "email_domain": "university.edu",
+    "requires_email_verification": True,
+    "field_mapping": {
+        "first_name": "[name='first']",
+        "last_name": "[name='last']",
+        "email": "[name='email']",
+        "phone": "[name='mobile']",
+        "date_of_birth": "[name='birthdate']"
     }
+}
+
+# Saved by create_example_configs, by file name
+_EXAMPLE_CONFIGS = {
+    'common_app_style_example': _COMMON_APP_STYLE,
+    'slate_style_example': _SLATE_STYLE,
+}
+
+
+def create_example_configs():
+    """Create example configurations for common university platforms"""
     
-    # Save examples
-    save_university_config(common_app_style, 'common_app_style_example')
-    save_university_config(slate_style, 'slate_style_example')
+    # Files are independent, so they are written concurrently
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(save_university_config, _EXAMPLE_CONFIGS.values(), _EXAMPLE_CONFIGS))
     
     print("\n✓ Example configurations created:")
-    print("  - common_app_style_example.json")
-    print("  - slate_style_example.json")
+    for filename in _EXAMPLE_CONFIGS:
+        print(f"  - {filename}.json")
 
 
 def main():
@@ -298,7 +369,7 @@ def main():
     print("  python university_config.py")
     
     # Create template
-    template = create_university_config_template()
+    template = create_university_config_template_readonly()
     save_university_config(template, 'template')
     
     # Show guide